@@ -1,8 +1,13 @@
 """
 Main module for running the Tic Tac Toe game.
 This module initializes the game, manages player turns, and tracks scores across multiple games.
+Games between two computer players run without any prompts and print one JSON line per game.
 """
 
+import argparse
+import os
+import sys
+
 from src import deftoe
 
 # Game variables
@@ -13,68 +18,333 @@ player2_symbol = '⭕'   # Player 2 symbol
 empty_tile = '⬜'       # Empty or hidden tile symbol
 blocked_tile = '⬛'     # Blocked tile symbol
 board_size = 3         # Board size, e.g., 3 means 3x3
+checkpoint_path = "toe_checkpoint.bin"  # Saved progress of an interrupted session
+checkpoint_interval = 5.0  # Seconds between checkpoints of games between computers
 
-# Initialize win counters
-player1_wins = 0
-player2_wins = 0
-draws = 0
-
-# Display instructions to players
-deftoe.instructions(player1_symbol, player2_symbol)
-
-# Set the starting player
-first_symbol = player1_symbol  # Player 1 starts first
-second_symbol = player2_symbol
-
-# Ask for game mode
-print("Welcome to Tic-Tac-Toe in the Dark!")
-print("Choose game mode:")
-print("1 - Two players")
-print("2 - Play against computer - easy mode")
-print("3 - Play against computer - medium mode")
-mode = input("Enter 1 or 2 or 3: ").strip()
-
-# Main game loop
-while True:
-    if mode == "2":
-        # Player vs Computer
-        result = deftoe.game_vs_random_computer(player1_symbol, player2_symbol, board_size, empty_tile, blocked_tile)
-    elif mode == "3":
-        # Player vs Computer
-        result = deftoe.game_vs_smart_computer(player1_symbol, player2_symbol, board_size, empty_tile, blocked_tile)
-    else:
-        # Two players
-        result = deftoe.game(first_symbol, second_symbol, board_size, empty_tile, blocked_tile)
-    
-    # Update counters based on the game result
-    if result == player1_symbol:
-        player1_wins += 1
-    elif result == player2_symbol:
-        player2_wins += 1
-    elif result == "draw":
-        draws += 1
-    else:
-        print("Unexpected result:", result)
-    
-    # Print the current score
-    print(f"\nCurrent Score:")
-    print(f"Player 1 ({player1_symbol}): {player1_wins}")
-    print(f"Player 2 ({player2_symbol}): {player2_wins}")
-    print(f"Draws: {draws}\n")
-    
-    # Ask players if they want to play again
-    play_again = input("Do you want to play again? (yes/no): ").strip().lower()
-    if play_again not in ["yes", "y"]:
-        print("Thanks for playing! Final Score:")
+# Player types and the interactive game modes they correspond to
+player_types = ("human", "random", "smart", "threat")
+modes = {"1": ("human", "human"), "2": ("human", "random"), "3": ("human", "smart"), "4": ("human", "threat")}
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Args:
+        argv (list): The arguments to parse (defaults to `sys.argv[1:]`).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe in the Dark.")
+    parser.add_argument("--mode", choices=sorted(modes),
+                        help="interactive game mode: 1 two players, 2 easy computer, 3 medium computer, "
+                             "4 hard computer")
+    parser.add_argument("--player1", choices=player_types, help="type of player 1")
+    parser.add_argument("--player2", choices=player_types, help="type of player 2")
+    parser.add_argument("--board-size", type=int, default=board_size, help="board size, e.g. 3 means 3x3")
+    parser.add_argument("--games", type=int, help="number of games to play (default: ask after every game, "
+                                                  "or 1 game between computers)")
+    parser.add_argument("--seed", type=int, help="seed of the first game; game N uses seed + N - 1")
+    parser.add_argument("--ratings", metavar="FILE", help="update the computer ratings stored in FILE")
+    parser.add_argument("--checkpoint", metavar="FILE",
+                        help="save the progress of games between computers to FILE and resume from it")
+    args = parser.parse_args(argv)
+
+    if args.mode and (args.player1 or args.player2):
+        parser.error("--mode cannot be combined with --player1/--player2")
+    if args.mode:
+        args.player1, args.player2 = modes[args.mode]
+    elif args.player1 or args.player2:
+        args.player1 = args.player1 or "human"
+        args.player2 = args.player2 or "human"
+        if args.player1 != "human" and args.player2 == "human":
+            parser.error("a human player must be player 1")
+        if args.player1 == "human":
+            args.mode = next(mode for mode, players in modes.items() if players == (args.player1, args.player2))
+    if args.checkpoint and (args.player1 or "human") == "human":
+        parser.error("--checkpoint is only used for games between computers")
+    if args.board_size < 1 or args.board_size > 26:
+        parser.error("--board-size must be between 1 and 26")
+    if args.games is not None and args.games < 1:
+        parser.error("--games must be at least 1")
+    return args
+
+
+def _ratings_to_extra(ratings) -> dict:
+    """
+    Encodes the state of a rating engine as checkpoint settings (short strings, exact floats).
+    """
+    extra = {"first_move_advantage": repr(ratings.first_move_advantage)}
+    for player, rating in ratings.ratings.items():
+        extra[f"rating:{player}"] = ",".join(repr(value) for value in rating)
+    return extra
+
+
+def _ratings_from_extra(ratings, extra: dict) -> None:
+    """
+    Restores the state of a rating engine from checkpoint settings written by `_ratings_to_extra`.
+    """
+    from src.rating import Rating
+
+    ratings.first_move_advantage = float(extra["first_move_advantage"])
+    ratings.ratings = {}
+    for key, value in extra.items():
+        if key.startswith("rating:"):
+            rating, deviation, volatility, games = value.split(",")
+            ratings.ratings[key[len("rating:"):]] = Rating(float(rating), float(deviation), float(volatility),
+                                                           int(games))
+
+
+def play_computer_games(args: argparse.Namespace, output=sys.stdout) -> None:
+    """
+    Plays games between two computer players and writes one JSON line per finished game.
+    The starting player alternates between games. With `--ratings`, the updated ratings
+    and their confidence intervals are reported on stderr.
+
+    With `--checkpoint`, the number of finished games, the scores, the random state and the
+    ratings are saved every `checkpoint_interval` seconds. Running the same command again
+    resumes after the last saved game; the checkpoint is removed once the run is complete.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+        output (file): Where to write the JSON lines.
+
+    Raises:
+        ValueError: If the checkpoint is broken or belongs to a run with other settings.
+    """
+    import json
+    import random
+    from src.batch import computer_move
+
+    strategies = {player1_symbol: args.player1, player2_symbol: args.player2}
+    names = {player1_symbol: "player1", player2_symbol: "player2"}
+    scores = {player1_symbol: 0, player2_symbol: 0, "draw": 0}
+    ratings = None
+    if args.ratings:
+        from src.rating import RatingEngine
+        ratings = RatingEngine.load(args.ratings) if os.path.exists(args.ratings) else RatingEngine()
+    if "threat" in strategies.values():
+        from src.threats import ThreatEvaluator
+
+    checkpointer = None
+    first_game = 1
+    settings = {"player1": args.player1, "player2": args.player2, "board_size": str(args.board_size),
+                "seed": str(args.seed), "ratings": str(args.ratings)}
+    if args.checkpoint:
+        from src import checkpoint
+        checkpointer = checkpoint.Checkpointer(args.checkpoint, interval=checkpoint_interval)
+        if os.path.exists(args.checkpoint):
+            saved = checkpoint.load(args.checkpoint)
+            if any(saved.extra.get(key) != value for key, value in settings.items()):
+                raise ValueError(f"{args.checkpoint} belongs to a run with other settings.")
+            first_game = int(saved.extra["game"]) + 1
+            scores = dict(zip(scores, saved.scores))
+            if saved.random_state:
+                random.setstate(saved.random_state)
+            if ratings:
+                _ratings_from_extra(ratings, saved.extra)
+
+    for game_number in range(first_game, (args.games or 1) + 1):
+        # Player 1 starts the odd games
+        first_symbol, second_symbol = player1_symbol, player2_symbol
+        if game_number % 2 == 0:
+            first_symbol, second_symbol = second_symbol, first_symbol
+        seed = args.seed + game_number - 1 if args.seed is not None else random.randrange(2 ** 32)
+        rng = random.Random(seed)
+        state = deftoe.GameState(first_symbol, second_symbol, args.board_size, empty_tile, blocked_tile)
+        evaluators = {}
+        for symbol, strategy in strategies.items():
+            if strategy == "threat":
+                other = deftoe.switch_player(symbol, player1_symbol, player2_symbol)
+                evaluators[symbol] = ThreatEvaluator(args.board_size, symbol, other, empty_tile, blocked_tile)
+        while state.status == "continue":
+            current = state.current_player_symbol
+            if current in evaluators:
+                state.push(*evaluators[current].best_move(state))
+            else:
+                state.push(*computer_move(state, strategies[current], rng))
+
+        scores[state.status] += 1
+        output.write(json.dumps({
+            "game": game_number,
+            "seed": seed,
+            "board_size": args.board_size,
+            "player1": args.player1,
+            "player2": args.player2,
+            "first": names[first_symbol],
+            "result": names.get(state.status, "draw"),
+            "moves": state.performed_moves,
+        }) + "\n")
+        if ratings and args.player1 != args.player2:
+            winner = strategies.get(state.status, "draw")
+            ratings.update(strategies[first_symbol], strategies[second_symbol], winner)
+
+        if checkpointer:
+            # Flush first, so no game in a checkpoint is missing from the output
+            output.flush()
+            checkpointer.maybe_save([], tuple(scores.values()), random.getstate(), {
+                **settings, "game": str(game_number), **(_ratings_to_extra(ratings) if ratings else {})
+            })
+
+    output.flush()
+    if ratings:
+        ratings.save(args.ratings)
+        # Report to stderr, so stdout stays pure JSON lines
+        for player in sorted(ratings.ratings):
+            rating = ratings.get(player)
+            low, high = ratings.interval(player)
+            print(f"{player}: {rating.rating:.0f} (95% interval {low:.0f} to {high:.0f}, {rating.games} games)",
+                  file=sys.stderr)
+    if checkpointer:
+        checkpointer.remove()
+
+
+def play_interactive(args: argparse.Namespace) -> None:
+    """
+    Runs the interactive session: instructions, game mode, resuming and score tracking.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+    """
+    import random
+    from src import checkpoint
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    # Initialize win counters
+    player1_wins = 0
+    player2_wins = 0
+    draws = 0
+
+    # Display instructions to players
+    deftoe.instructions(player1_symbol, player2_symbol)
+
+    # Set the starting player
+    first_symbol = player1_symbol  # Player 1 starts first
+    second_symbol = player2_symbol
+
+    # Offer to resume an interrupted session, otherwise ask for game mode
+    print("Welcome to Tic-Tac-Toe in the Dark!")
+    resumed_game = None
+    mode = args.mode
+    size = args.board_size
+    saved = None
+    if os.path.exists(checkpoint_path) and input("Resume the saved session? (yes/no): ").strip().lower() in ["yes", "y"]:
+        try:
+            saved = checkpoint.load(checkpoint_path)
+        except ValueError as error:
+            print(f"The saved session cannot be resumed ({error}). Starting a new session.")
+    if saved is not None:
+        player1_wins, player2_wins, draws = saved.scores
+        mode = saved.extra["mode"]
+        size = int(saved.extra.get("board_size", saved.games[0].board_size if saved.games else size))
+        first_symbol = saved.extra["first_symbol"]
+        second_symbol = deftoe.switch_player(first_symbol, player1_symbol, player2_symbol)
+        if saved.random_state:
+            random.setstate(saved.random_state)
+        if saved.games:
+            resumed_game = saved.games[0]
+    elif mode is None:
+        print("Choose game mode:")
+        print("1 - Two players")
+        print("2 - Play against computer - easy mode")
+        print("3 - Play against computer - medium mode")
+        print("4 - Play against computer - hard mode")
+        mode = input("Enter 1, 2, 3 or 4: ").strip()
+
+    checkpointer = checkpoint.Checkpointer(checkpoint_path, interval=0)
+
+    def save_progress(state=None):
+        """
+        Saves the scores and the game in progress (if any) so the session can be resumed.
+        """
+        checkpointer.maybe_save(
+            [state] if state and state.status == "continue" else [],
+            (player1_wins, player2_wins, draws),
+            random.getstate(),
+            {"mode": mode, "first_symbol": first_symbol, "board_size": str(size)},
+        )
+
+    # Main game loop
+    games_played = 0
+    while True:
+        if mode == "2":
+            # Player vs Computer
+            result = deftoe.game_vs_random_computer(player1_symbol, player2_symbol, size, empty_tile,
+                                                    blocked_tile, state=resumed_game, on_move=save_progress)
+        elif mode == "3":
+            # Player vs Computer
+            result = deftoe.game_vs_smart_computer(player1_symbol, player2_symbol, size, empty_tile,
+                                                   blocked_tile, state=resumed_game, on_move=save_progress)
+        elif mode == "4":
+            # Player vs Computer
+            result = deftoe.game_vs_threat_computer(player1_symbol, player2_symbol, size, empty_tile,
+                                                    blocked_tile, state=resumed_game, on_move=save_progress)
+        else:
+            # Two players
+            result = deftoe.game(first_symbol, second_symbol, size, empty_tile, blocked_tile,
+                                 state=resumed_game, on_move=save_progress)
+        resumed_game = None
+        games_played += 1
+
+        # Update counters based on the game result
+        if result == player1_symbol:
+            player1_wins += 1
+        elif result == player2_symbol:
+            player2_wins += 1
+        elif result == "draw":
+            draws += 1
+        else:
+            print("Unexpected result:", result)
+
+        # Print the current score
+        print(f"\nCurrent Score:")
         print(f"Player 1 ({player1_symbol}): {player1_wins}")
         print(f"Player 2 ({player2_symbol}): {player2_wins}")
-        print(f"Draws: {draws}")
-        break
+        print(f"Draws: {draws}\n")
+
+        # Switch who starts first for the next game
+        first_symbol = deftoe.switch_player(first_symbol, player1_symbol, player2_symbol)
+        second_symbol = deftoe.switch_player(second_symbol, player1_symbol, player2_symbol)
+        save_progress()
+
+        # Ask players if they want to play again, unless the number of games was given
+        if args.games is not None:
+            play_again = "yes" if games_played < args.games else "no"
+        else:
+            play_again = input("Do you want to play again? (yes/no): ").strip().lower()
+        if play_again not in ["yes", "y"]:
+            print("Thanks for playing! Final Score:")
+            print(f"Player 1 ({player1_symbol}): {player1_wins}")
+            print(f"Player 2 ({player2_symbol}): {player2_wins}")
+            print(f"Draws: {draws}")
+            checkpointer.remove()
+            break
 
-    # Switch who starts first for the next game
 
-    first_symbol = deftoe.switch_player(first_symbol, player1_symbol, player2_symbol)
-    second_symbol = deftoe.switch_player(second_symbol, player1_symbol, player2_symbol)
+def main(argv=None) -> int:
+    """
+    Entry point: plays computer-only games non-interactively, everything else interactively.
 
+    Args:
+        argv (list): The command line arguments (defaults to `sys.argv[1:]`).
+
+    Returns:
+        int: The exit code.
+    """
+    args = parse_args(argv)
+    if args.player1 and args.player1 != "human":
+        try:
+            play_computer_games(args)
+        except ValueError as error:
+            print(f"error: {error}", file=sys.stderr)
+            return 1
+    else:
+        play_interactive(args)
+    return 0
 
 
+if __name__ == "__main__":
+    sys.exit(main())
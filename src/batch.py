@@ -0,0 +1,118 @@
+from typing import List, Optional, Sequence, Tuple
+import random
+
+from src.bitboard import line_masks, mask_to_cells
+
+"""
+Batch module for Tic Tac Toe game.
+This module selects computer moves for many games in one call. Boards are converted
+to bitmasks once per game and win/block detection runs on the shared line masks,
+so a server can serve thousands of pending computer turns without per-game overhead.
+"""
+
+STRATEGIES = ("random", "smart")
+
+
+def _board_masks(board_with_all_moves: List[List[str]], board_with_hidden_moves: List[List[str]],
+                 computer_symbol: str, player_symbol: str, empty_tile: str) -> Tuple[int, int, int, int]:
+    """
+    Converts the boards of one game into bitmasks in a single pass.
+
+    Returns:
+        tuple: Masks of computer stones, player stones, empty tiles and hidden empty tiles.
+    """
+    computer = player = empty = hidden_empty = 0
+    bit = 1
+    for row_all, row_hidden in zip(board_with_all_moves, board_with_hidden_moves):
+        for cell, hidden_cell in zip(row_all, row_hidden):
+            if cell == empty_tile:
+                empty |= bit
+            elif cell == computer_symbol:
+                computer |= bit
+            elif cell == player_symbol:
+                player |= bit
+            if hidden_cell == empty_tile:
+                hidden_empty |= bit
+            bit <<= 1
+    return computer, player, empty, hidden_empty
+
+
+def winning_cells(own_mask: int, empty_mask: int, lines: Sequence[int]) -> int:
+    """
+    Finds all empty cells that complete a line for the owner of `own_mask`.
+
+    Args:
+        own_mask (int): Bitmask of the player's stones.
+        empty_mask (int): Bitmask of the empty tiles.
+        lines (Sequence[int]): Bitmasks of the winning lines.
+
+    Returns:
+        int: Bitmask of the winning cells.
+    """
+    wins = 0
+    for line in lines:
+        missing = line & ~own_mask
+        if missing and not missing & (missing - 1) and missing & empty_mask:
+            wins |= missing
+    return wins
+
+
+def select_computer_moves(games: Sequence[tuple], empty_tile: str, strategy: str = "smart",
+                          rng: Optional[random.Random] = None) -> List[tuple]:
+    """
+    Selects the computer move for every game of a batch.
+
+    The "random" strategy picks a random empty tile of `board_with_hidden_moves`
+    (the computer of `game_vs_random_computer`). The "smart" strategy first wins if
+    possible, then blocks the player, otherwise picks randomly (the computer of
+    `game_vs_smart_computer`; win and block moves are the first such tiles in row-major order).
+
+    Args:
+        games (Sequence[tuple]): Game states as tuples of
+            (board_with_all_moves, board_with_hidden_moves, computer_symbol, player_symbol).
+        empty_tile (str): The symbol representing an empty tile.
+        strategy (str): Either "random" or "smart".
+        rng (random.Random): Random generator used for random picks.
+
+    Returns:
+        list: A (row, col) tuple for every game, in the order of `games`.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy!r}. Expected one of {STRATEGIES}.")
+    rng = rng or random
+    smart = strategy == "smart"
+    moves = []
+    for board_with_all_moves, board_with_hidden_moves, computer_symbol, player_symbol in games:
+        board_size = len(board_with_all_moves)
+        computer, player, empty, hidden_empty = _board_masks(
+            board_with_all_moves, board_with_hidden_moves, computer_symbol, player_symbol, empty_tile
+        )
+        target = 0
+        if smart:
+            lines = line_masks(board_size)
+            target = winning_cells(computer, empty, lines) or winning_cells(player, empty, lines)
+        if target:
+            cell = (target & -target).bit_length() - 1
+        else:
+            cell = rng.choice(mask_to_cells(hidden_empty))
+        moves.append(divmod(cell, board_size))
+    return moves
+
+
+def computer_move(state, strategy: str, rng: Optional[random.Random] = None) -> tuple:
+    """
+    Selects the computer move for the current player of a single game.
+
+    Args:
+        state (GameState): The game state; the current player is the computer.
+        strategy (str): Either "random" or "smart".
+        rng (random.Random): Random generator used for random picks.
+
+    Returns:
+        tuple: The (row, col) of the move.
+    """
+    current = state.current_player_symbol
+    other = state.second_symbol if current == state.first_symbol else state.first_symbol
+    return select_computer_moves(
+        [(state.board_with_all_moves, state.board_with_hidden_moves, current, other)], state.empty_tile, strategy, rng
+    )[0]
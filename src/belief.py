@@ -0,0 +1,210 @@
+from math import comb
+from typing import List, Optional
+import random
+
+from src.bitboard import board_to_mask, cell_bit, full_mask, has_line_through, mask_to_cells
+
+"""
+Belief-state module for Tic Tac Toe game.
+This module tracks where the opponent's hidden stones can be, given only what a player
+sees on `board_with_hidden_moves`, the number of opponent moves and the player's own moves.
+
+Every opponent placement since the last reveal is unknown. A configuration of those
+hidden stones is stored as a bitmask and is consistent if it avoids the player's own stones,
+known stones and blocked tiles and does not complete an opponent line (the game would
+have ended). A random opponent reaches every consistent configuration with the same
+probability, so all configurations are weighted equally. Small belief sets are enumerated
+exactly; large ones are approximated with a fixed number of particles.
+"""
+
+class BeliefState:
+    """
+    Incremental belief over the opponent's hidden stones.
+
+    Call `observe_own_move` after each of the player's own successful placements,
+    `observe_opponent_move` after each opponent turn that did not reveal the board,
+    `observe_reveal` whenever the hidden board is revealed (after three moves or after a
+    blocked tile) and `observe_clear` when blocked tiles are cleared on a full board.
+    Per-cell occupancy probabilities are cached after every update, so `probability`
+    and `probabilities` are cheap to query.
+    """
+
+    def __init__(self, board_size: int, max_configurations: int = 1000,
+                 particles: int = 500, rng: Optional[random.Random] = None) -> None:
+        """
+        Args:
+            board_size (int): The size of the board (number of rows and columns).
+            max_configurations (int): Largest belief set that is enumerated exactly.
+            particles (int): Number of particles used once the belief set is too large.
+            rng (random.Random): Random generator for particle sampling.
+        """
+        self.board_size = board_size
+        self.max_configurations = max_configurations
+        self.particle_count = particles
+        self.rng = rng or random.Random()
+        self.own_mask = 0
+        self.opponent_mask = 0
+        self.blocked_mask = 0
+        self.hidden_count = 0
+        self.configurations = {0}
+        self.particles = None
+        self._probabilities = [0.0] * (board_size * board_size)
+
+    @property
+    def is_exact(self) -> bool:
+        """
+        bool: True while the belief set is enumerated exactly, False in particle mode.
+        """
+        return self.particles is None
+
+    def free_mask(self) -> int:
+        """
+        Returns the mask of cells that may hold a hidden opponent stone.
+
+        Returns:
+            int: Bitmask of cells not known to be own, opponent or blocked.
+        """
+        return full_mask(self.board_size) & ~(self.own_mask | self.opponent_mask | self.blocked_mask)
+
+    def observe_own_move(self, row: int, col: int) -> None:
+        """
+        Records a successful own placement; the opponent cannot have been on that cell.
+
+        Args:
+            row (int): The row index of the move (0-based).
+            col (int): The column index of the move (0-based).
+        """
+        bit = cell_bit(row, col, self.board_size)
+        self.own_mask |= bit
+        if self.particles is None:
+            self.configurations = {config for config in self.configurations if not config & bit}
+        else:
+            free_cells = mask_to_cells(self.free_mask())
+            self.particles = [
+                self._extend(particle ^ bit, free_cells) if particle & bit else particle
+                for particle in self.particles
+            ]
+        self._check_consistent()
+        self._update_probabilities()
+
+    def observe_opponent_move(self) -> None:
+        """
+        Records an opponent placement that stayed hidden.
+        """
+        self.hidden_count += 1
+        free = self.free_mask()
+        if self.particles is None:
+            free_count = bin(free).count("1")
+            if comb(free_count, self.hidden_count) > self.max_configurations:
+                free_cells = mask_to_cells(free)
+                pool = tuple(self.configurations)
+                self.particles = [
+                    self._extend(config, free_cells) for config in self.rng.choices(pool, k=self.particle_count)
+                ]
+            else:
+                # Known configurations hold no complete line, so only lines through the new stone are checked
+                opponent_mask, size = self.opponent_mask, self.board_size
+                self.configurations = {
+                    config | (1 << cell)
+                    for config in self.configurations
+                    for cell in mask_to_cells(free & ~config)
+                    if not has_line_through(opponent_mask | config | (1 << cell), cell, size)
+                }
+        else:
+            free_cells = mask_to_cells(free)
+            self.particles = [self._extend(particle, free_cells) for particle in self.particles]
+        self._check_consistent()
+        self._update_probabilities()
+
+    def observe_reveal(self, board: List[List[str]], own_symbol: str,
+                       opponent_symbol: str, blocked_tile: str) -> None:
+        """
+        Collapses the belief onto a revealed board.
+
+        Args:
+            board (list): The revealed board (`board_with_hidden_moves` after a reveal).
+            own_symbol (str): The symbol of the tracking player.
+            opponent_symbol (str): The symbol of the opponent.
+            blocked_tile (str): The symbol representing a blocked tile.
+        """
+        self.own_mask = board_to_mask(board, own_symbol)
+        self.opponent_mask = board_to_mask(board, opponent_symbol)
+        self.blocked_mask = board_to_mask(board, blocked_tile)
+        self.hidden_count = 0
+        self.configurations = {0}
+        self.particles = None
+        self._update_probabilities()
+
+    def observe_clear(self) -> None:
+        """
+        Records that blocked tiles were cleared. Stones stay where they are,
+        so only the blocked tiles become free again.
+        """
+        self.blocked_mask = 0
+        self._update_probabilities()
+
+    def probability(self, row: int, col: int) -> float:
+        """
+        Returns the probability that the opponent occupies a cell.
+
+        Args:
+            row (int): The row index of the cell (0-based).
+            col (int): The column index of the cell (0-based).
+
+        Returns:
+            float: Occupancy probability between 0 and 1.
+        """
+        return self._probabilities[row * self.board_size + col]
+
+    def probabilities(self) -> List[List[float]]:
+        """
+        Returns the occupancy probabilities of all cells.
+
+        Returns:
+            list: A 2D list of probabilities with the shape of the board.
+        """
+        size = self.board_size
+        return [self._probabilities[row * size:(row + 1) * size] for row in range(size)]
+
+    def _extend(self, particle: int, free_cells: List[int]) -> int:
+        """
+        Adds one random hidden stone to a particle, avoiding completed opponent lines if possible.
+        """
+        rng, opponent_mask, size = self.rng, self.opponent_mask, self.board_size
+        # Rejection sampling is cheap while the particle covers few of the free cells
+        for _ in range(len(free_cells)):
+            cell = rng.choice(free_cells)
+            if not particle >> cell & 1:
+                extended = particle | (1 << cell)
+                if not has_line_through(opponent_mask | extended, cell, size):
+                    return extended
+        cells = [cell for cell in free_cells if not particle >> cell & 1]
+        if not cells:
+            raise ValueError("No free cell left for a hidden opponent stone.")
+        rng.shuffle(cells)
+        for cell in cells:
+            extended = particle | (1 << cell)
+            if not has_line_through(opponent_mask | extended, cell, size):
+                return extended
+        return particle | (1 << cells[0])
+
+    def _check_consistent(self) -> None:
+        """
+        Raises ValueError if no configuration explains the observations.
+        """
+        if self.particles is None and not self.configurations:
+            raise ValueError("Observations are inconsistent with any opponent placement.")
+
+    def _update_probabilities(self) -> None:
+        """
+        Recomputes the cached per-cell occupancy probabilities.
+        """
+        counts = [0] * (self.board_size * self.board_size)
+        samples = self.configurations if self.particles is None else self.particles
+        for sample in samples:
+            for cell in mask_to_cells(sample):
+                counts[cell] += 1
+        total = len(samples)
+        for cell in mask_to_cells(self.opponent_mask):
+            counts[cell] = total
+        self._probabilities = [count / total for count in counts]
@@ -0,0 +1,157 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+"""
+Bitboard helper module for Tic Tac Toe game.
+This module converts boards to integer bitmasks, where the cell (row, col)
+is the bit `row * board_size + col`, and provides the masks of winning lines.
+"""
+
+def cell_bit(row: int, col: int, board_size: int) -> int:
+    """
+    Returns the bitmask of a single cell.
+
+    Args:
+        row (int): The row index of the cell (0-based).
+        col (int): The column index of the cell (0-based).
+        board_size (int): The size of the board (number of rows and columns).
+
+    Returns:
+        int: Bitmask with only the bit of the cell set.
+    """
+    return 1 << (row * board_size + col)
+
+
+def full_mask(board_size: int) -> int:
+    """
+    Returns the bitmask with all cells of the board set.
+
+    Args:
+        board_size (int): The size of the board (number of rows and columns).
+
+    Returns:
+        int: Bitmask covering the whole board.
+    """
+    return (1 << (board_size * board_size)) - 1
+
+
+@lru_cache(maxsize=None)
+def line_masks(board_size: int) -> Tuple[int, ...]:
+    """
+    Returns the bitmasks of all winning lines (rows, columns and both diagonals),
+    matching the lines checked by `deftoe.check_win`.
+
+    Args:
+        board_size (int): The size of the board (number of rows and columns).
+
+    Returns:
+        tuple: Bitmasks of the winning lines.
+    """
+    rows = [sum(cell_bit(row, col, board_size) for col in range(board_size)) for row in range(board_size)]
+    cols = [sum(cell_bit(row, col, board_size) for row in range(board_size)) for col in range(board_size)]
+    diagonal = sum(cell_bit(i, i, board_size) for i in range(board_size))
+    anti_diagonal = sum(cell_bit(i, board_size - 1 - i, board_size) for i in range(board_size))
+    return tuple(rows + cols + [diagonal, anti_diagonal])
+
+
+@lru_cache(maxsize=None)
+def cell_lines(board_size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Returns, for every cell index, the indices (into `line_masks`) of the winning lines
+    passing through that cell.
+
+    Args:
+        board_size (int): The size of the board (number of rows and columns).
+
+    Returns:
+        tuple: A tuple indexed by cell index, each item a tuple of line indices.
+    """
+    masks = line_masks(board_size)
+    return tuple(
+        tuple(index for index, line in enumerate(masks) if line >> cell & 1)
+        for cell in range(board_size * board_size)
+    )
+
+
+@lru_cache(maxsize=None)
+def cell_line_masks(board_size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Returns, for every cell index, the bitmasks of the winning lines passing through that cell.
+
+    Args:
+        board_size (int): The size of the board (number of rows and columns).
+
+    Returns:
+        tuple: A tuple indexed by cell index, each item a tuple of line bitmasks.
+    """
+    masks = line_masks(board_size)
+    return tuple(tuple(masks[index] for index in lines) for lines in cell_lines(board_size))
+
+
+def board_to_mask(board: List[List[str]], symbol: str) -> int:
+    """
+    Converts the cells of a board holding the given symbol into a bitmask.
+
+    Args:
+        board (list): A 2D list representing the Tic Tac Toe board.
+        symbol (str): The symbol to collect.
+
+    Returns:
+        int: Bitmask of the cells holding `symbol`.
+    """
+    mask = 0
+    bit = 1
+    for row in board:
+        for cell in row:
+            if cell == symbol:
+                mask |= bit
+            bit <<= 1
+    return mask
+
+
+def mask_to_cells(mask: int) -> List[int]:
+    """
+    Lists the cell indices of the set bits of a mask in ascending (row-major) order.
+
+    Args:
+        mask (int): The bitmask.
+
+    Returns:
+        list: Cell indices of the set bits.
+    """
+    cells = []
+    while mask:
+        low = mask & -mask
+        cells.append(low.bit_length() - 1)
+        mask ^= low
+    return cells
+
+
+def has_line(mask: int, board_size: int) -> bool:
+    """
+    Checks if the mask covers a complete winning line.
+
+    Args:
+        mask (int): The bitmask of one player's stones.
+        board_size (int): The size of the board (number of rows and columns).
+
+    Returns:
+        bool: True if any winning line is fully covered, False otherwise.
+    """
+    return any(mask & line == line for line in line_masks(board_size))
+
+
+def has_line_through(mask: int, cell: int, board_size: int) -> bool:
+    """
+    Checks if the mask covers a complete winning line through the given cell. Cheaper than
+    `has_line` when only that cell was added to a mask without a complete line.
+
+    Args:
+        mask (int): The bitmask of one player's stones.
+        cell (int): The cell index the lines must pass through.
+        board_size (int): The size of the board (number of rows and columns).
+
+    Returns:
+        bool: True if a winning line through the cell is fully covered, False otherwise.
+    """
+    return any(mask & line == line for line in cell_line_masks(board_size)[cell])
@@ -0,0 +1,272 @@
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+import os
+import struct
+import time
+
+from src.deftoe import GameState
+
+"""
+Checkpoint module for Tic Tac Toe game.
+This module snapshots games in progress, score counters and the random generator state
+into a compact versioned binary format and writes checkpoints atomically.
+
+Layout (little-endian), version 1:
+    magic b"TTTD", version (B)
+    symbol table: count (B), then length (B) + UTF-8 bytes per symbol
+    scores: count (I), then one (q) per counter
+    extra: count (B) of strings, then alternating keys and values like the symbol table
+    random state: present flag (B), then version (B), 625 x (I), gauss flag (B) + (d)
+    games: count (I), then per game the header (HBBBBBI) of board size, first, second,
+    current player, empty and blocked tile indices and performed moves, followed by one
+    symbol index byte per tile of the board with all moves and of the hidden board.
+The undo stack of a game is not saved; a resumed game starts with an empty one.
+"""
+
+MAGIC = b"TTTD"
+VERSION = 1
+_GAME_HEADER = struct.Struct("<HBBBBBI")
+_RANDOM_STATE = struct.Struct("<625I")
+_BYTE = struct.Struct("<B")
+_COUNT = struct.Struct("<I")
+_GAUSS = struct.Struct("<Bd")
+
+
+class Checkpoint(NamedTuple):
+    """
+    Contents of a checkpoint.
+
+    Attributes:
+        games (List[GameState]): Games in progress.
+        scores (Tuple[int, ...]): Score counters, e.g. player 1 wins, player 2 wins and draws.
+        random_state (tuple): State of the `random` module as returned by `random.getstate()`, or None.
+        extra (Dict[str, str]): Small settings of the run, e.g. the game mode.
+    """
+    games: List[GameState]
+    scores: Tuple[int, ...]
+    random_state: Optional[tuple]
+    extra: Dict[str, str]
+
+
+def _pack_strings(strings: Sequence[str]) -> bytes:
+    """
+    Packs a short list of short strings as a count followed by length-prefixed UTF-8.
+    """
+    parts = [struct.pack("<B", len(strings))]
+    for string in strings:
+        encoded = string.encode("utf-8")
+        parts.append(struct.pack("<B", len(encoded)) + encoded)
+    return b"".join(parts)
+
+
+def _end(data: bytes, offset: int, size: int) -> int:
+    """
+    Returns the offset after reading `size` bytes, raising ValueError if the data is too short.
+    """
+    end = offset + size
+    if end > len(data):
+        raise ValueError("Truncated checkpoint.")
+    return end
+
+
+def _unpack(layout: struct.Struct, data: bytes, offset: int) -> Tuple[tuple, int]:
+    """
+    Unpacks a fixed-size structure, returning its values and the new offset.
+    """
+    end = _end(data, offset, layout.size)
+    return layout.unpack_from(data, offset), end
+
+
+def _unpack_strings(data: bytes, offset: int) -> Tuple[List[str], int]:
+    """
+    Reads strings written by `_pack_strings`, returning them and the new offset.
+    """
+    (count,), offset = _unpack(_BYTE, data, offset)
+    strings = []
+    for _ in range(count):
+        (length,), offset = _unpack(_BYTE, data, offset)
+        end = _end(data, offset, length)
+        strings.append(data[offset:end].decode("utf-8"))
+        offset = end
+    return strings, offset
+
+
+def dumps(games: Sequence[GameState], scores: Sequence[int] = (), random_state: Optional[tuple] = None,
+          extra: Optional[Dict[str, str]] = None) -> bytes:
+    """
+    Serializes games, scores and the random state into the binary checkpoint format.
+
+    Args:
+        games (Sequence[GameState]): Games in progress.
+        scores (Sequence[int]): Score counters.
+        random_state (tuple): State from `random.getstate()`, or None.
+        extra (Dict[str, str]): Small settings of the run.
+
+    Returns:
+        bytes: The encoded checkpoint.
+    """
+    extra = extra or {}
+    symbols = {}
+    for game in games:
+        for symbol in (game.first_symbol, game.second_symbol, game.empty_tile, game.blocked_tile):
+            symbols.setdefault(symbol, len(symbols))
+        for board in (game.board_with_all_moves, game.board_with_hidden_moves):
+            for row in board:
+                for tile in row:
+                    symbols.setdefault(tile, len(symbols))
+    if len(symbols) > 255:
+        raise ValueError("Too many distinct symbols for a checkpoint.")
+
+    parts = [MAGIC, struct.pack("<B", VERSION), _pack_strings(list(symbols))]
+    parts.append(struct.pack(f"<I{len(scores)}q", len(scores), *scores))
+    parts.append(_pack_strings([item for pair in extra.items() for item in pair]))
+    if random_state is None:
+        parts.append(b"\x00")
+    else:
+        version, internal_state, gauss_next = random_state
+        parts.append(struct.pack("<BB", 1, version) + _RANDOM_STATE.pack(*internal_state))
+        parts.append(struct.pack("<Bd", gauss_next is not None, gauss_next or 0.0))
+
+    parts.append(struct.pack("<I", len(games)))
+    for game in games:
+        parts.append(_GAME_HEADER.pack(
+            game.board_size, symbols[game.first_symbol], symbols[game.second_symbol],
+            symbols[game.current_player_symbol], symbols[game.empty_tile], symbols[game.blocked_tile],
+            game.performed_moves
+        ))
+        parts.append(bytes([symbols[tile] for row in game.board_with_all_moves for tile in row]))
+        parts.append(bytes([symbols[tile] for row in game.board_with_hidden_moves for tile in row]))
+    return b"".join(parts)
+
+
+def loads(data: bytes) -> Checkpoint:
+    """
+    Deserializes a checkpoint written by `dumps`.
+
+    Args:
+        data (bytes): The encoded checkpoint.
+
+    Returns:
+        Checkpoint: The decoded games, scores, random state and settings.
+
+    Raises:
+        ValueError: If the data is not a complete checkpoint of a supported version.
+    """
+    if data[:4] != MAGIC:
+        raise ValueError("Not a Tic Tac Toe checkpoint.")
+    (version,), offset = _unpack(_BYTE, data, 4)
+    if version != VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {version}.")
+    symbols, offset = _unpack_strings(data, offset)
+
+    (score_count,), offset = _unpack(_COUNT, data, offset)
+    end = _end(data, offset, 8 * score_count)
+    scores = struct.unpack_from(f"<{score_count}q", data, offset)
+    offset = end
+
+    strings, offset = _unpack_strings(data, offset)
+    extra = dict(zip(strings[::2], strings[1::2]))
+
+    random_state = None
+    (has_random_state,), offset = _unpack(_BYTE, data, offset)
+    if has_random_state:
+        (version,), offset = _unpack(_BYTE, data, offset)
+        internal_state, offset = _unpack(_RANDOM_STATE, data, offset)
+        (has_gauss, gauss_next), offset = _unpack(_GAUSS, data, offset)
+        random_state = (version, internal_state, gauss_next if has_gauss else None)
+
+    (game_count,), offset = _unpack(_COUNT, data, offset)
+    games = []
+    for _ in range(game_count):
+        header, offset = _unpack(_GAME_HEADER, data, offset)
+        board_size, first, second, current, empty, blocked, performed_moves = header
+        tiles = board_size * board_size
+        end = _end(data, offset, 2 * tiles)
+        if max(data[offset:end], default=0) >= len(symbols) or max(header[1:6]) >= len(symbols):
+            raise ValueError("Checkpoint refers to an unknown symbol.")
+        boards = []
+        for _ in range(2):
+            cells = data[offset:offset + tiles]
+            boards.append([[symbols[index] for index in cells[row:row + board_size]]
+                           for row in range(0, tiles, board_size)])
+            offset += tiles
+        other = second if current == first else first
+        games.append(GameState.from_boards(boards[0], boards[1], symbols[current], symbols[other],
+                                           symbols[empty], symbols[blocked], performed_moves, copy_boards=False,
+                                           first_symbol=symbols[first], second_symbol=symbols[second]))
+    if offset != len(data):
+        raise ValueError("Unexpected data after the end of the checkpoint.")
+    return Checkpoint(games, tuple(scores), random_state, extra)
+
+
+def save(path: str, games: Sequence[GameState], scores: Sequence[int] = (), random_state: Optional[tuple] = None,
+         extra: Optional[Dict[str, str]] = None) -> None:
+    """
+    Writes a checkpoint atomically: the data goes to a temporary file that then replaces `path`,
+    so an interruption never leaves a partially written checkpoint behind.
+
+    Args:
+        path (str): The checkpoint file path.
+        games (Sequence[GameState]): Games in progress.
+        scores (Sequence[int]): Score counters.
+        random_state (tuple): State from `random.getstate()`, or None.
+        extra (Dict[str, str]): Small settings of the run.
+    """
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(dumps(games, scores, random_state, extra))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+
+
+def load(path: str) -> Checkpoint:
+    """
+    Reads a checkpoint file.
+
+    Args:
+        path (str): The checkpoint file path.
+
+    Returns:
+        Checkpoint: The decoded checkpoint.
+    """
+    with open(path, "rb") as file:
+        return loads(file.read())
+
+
+class Checkpointer:
+    """
+    Writes periodic checkpoints: `maybe_save` only saves when at least `interval`
+    seconds have passed since the last save.
+    """
+
+    def __init__(self, path: str, interval: float = 5.0) -> None:
+        """
+        Args:
+            path (str): The checkpoint file path.
+            interval (float): Minimum number of seconds between two saves.
+        """
+        self.path = path
+        self.interval = interval
+        self.last_save = None
+
+    def maybe_save(self, games: Sequence[GameState], scores: Sequence[int] = (),
+                   random_state: Optional[tuple] = None, extra: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Saves a checkpoint if the interval has elapsed.
+
+        Returns:
+            bool: True if a checkpoint was written.
+        """
+        now = time.monotonic()
+        if self.last_save is not None and now - self.last_save < self.interval:
+            return False
+        save(self.path, games, scores, random_state, extra)
+        self.last_save = now
+        return True
+
+    def remove(self) -> None:
+        """
+        Deletes the checkpoint file, e.g. after a run finished normally.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
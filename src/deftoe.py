@@ -1,8 +1,6 @@
-from typing import List
+from typing import Callable, List, NamedTuple, Optional
 from copy import deepcopy
 import os
-import platform
-import random
 
 """
 Function module for Tic Tac Toe game.
@@ -14,6 +12,8 @@ def clear_screen() -> None:
     Clears the console screen.
     """
     # Check the operating system and run the appropriate command
+    # (platform is imported here as it is slow to import and only needed on screen clears)
+    import platform
     if platform.system() == "Windows":
         os.system('cls')
     else:
@@ -109,6 +109,37 @@ def check_win(board: List[List[str]], player_symbol: str) -> bool:
     return False
 
 
+def check_win_at(board: List[List[str]], row: int, col: int, player_symbol: str) -> bool:
+    """
+    Checks if the specified player has won with a line passing through the given tile.
+    Only the lines through the last placed mark can have been completed by it, so this is
+    a cheaper replacement for `check_win` right after a move.
+
+    Args:
+        board (list): A 2D list representing the Tic Tac Toe board.
+        row (int): The row index of the last move (0-based).
+        col (int): The column index of the last move (0-based).
+        player_symbol (str): The player symbol to check for a win.
+
+    Returns:
+        bool: True if the player has won, False otherwise.
+    """
+    size = len(board)
+    if all(cell == player_symbol for cell in board[row]):
+        return True
+
+    if all(board[i][col] == player_symbol for i in range(size)):
+        return True
+
+    if row == col and all(board[i][i] == player_symbol for i in range(size)):
+        return True
+
+    if row + col == size - 1 and all(board[i][size - 1 - i] == player_symbol for i in range(size)):
+        return True
+
+    return False
+
+
 def is_board_full(board: List[List[str]], empty_tile: str) -> bool:
     """
     Checks if the game board is completely filled.
@@ -152,7 +183,7 @@ def is_move_to_empty_tile(board: List[List[str]], row: int, col: int, empty_tile
     return 0 <= row < len(board) and 0 <= col < len(board) and board[row][col] == empty_tile
 
 
-def get_valid_move(board: List[List[str]], empty_tile: str) -> tuple:
+def get_valid_move(board: List[List[str]], empty_tile: str, allow_undo: bool = False) -> Optional[tuple]:
     """
     Prompts the user to enter a valid move using a single input combining
     column letter and row number (e.g., 'B2', 'A10'), with dynamic range display.
@@ -160,17 +191,22 @@ def get_valid_move(board: List[List[str]], empty_tile: str) -> tuple:
     Args:
         board (list): A 2D list representing the Tic Tac Toe board.
         empty_tile (str): The symbol representing an empty tile.
+        allow_undo (bool): Whether the user may enter 'undo' instead of a move.
 
     Returns:
-        tuple: A tuple containing the valid row and column indices (0-based).
+        tuple: A tuple containing the valid row and column indices (0-based),
+               or None if the user asked to undo the last move.
     """
     board_size = len(board)
+    undo_hint = " or 'undo'" if allow_undo else ""
 
     while True:
         try:
             col_max = chr(65 + board_size - 1)
             row_max = board_size
-            move = input(f"Enter your move (between A1-{col_max}{row_max}): ").strip().upper()
+            move = input(f"Enter your move (between A1-{col_max}{row_max}){undo_hint}: ").strip().upper()
+            if allow_undo and move == "UNDO":
+                return None
             col_letter, row_number = parse_move(move)
             row = int(row_number) - 1
             col = ord(col_letter) - 65
@@ -202,6 +238,76 @@ def clear_tiles(board: List[List[str]], blocked_tile: str, empty_tile: str, clea
                 board[i][j] = empty_tile
 
 
+def reveal_moves(board_with_all_moves: List[List[str]], board_with_hidden_moves: List[List[str]],
+                 changes: Optional[list] = None) -> None:
+    """
+    Copies all moves onto the hidden board in place.
+
+    Args:
+        board_with_all_moves (List[List[str]]): The board showing all moves.
+        board_with_hidden_moves (List[List[str]]): The board with hidden moves.
+        changes (list): If given, (board, i, j, previous tile) is appended for every changed tile.
+    """
+    for i, (row, hidden_row) in enumerate(zip(board_with_all_moves, board_with_hidden_moves)):
+        for j, tile in enumerate(row):
+            if hidden_row[j] != tile:
+                if changes is not None:
+                    changes.append((board_with_hidden_moves, i, j, hidden_row[j]))
+                hidden_row[j] = tile
+
+
+def place_move(row: int, col: int, board_with_all_moves: List[List[str]],
+               board_with_hidden_moves: List[List[str]], current_player_symbol: str,
+               empty_tile: str, blocked_tile: str, changes: Optional[list] = None) -> bool:
+    """
+    Applies a validated move to the boards: places the player's symbol on an empty tile,
+    otherwise blocks the tile and reveals all moves on the hidden board.
+
+    Args:
+        row (int): The row index of the move.
+        col (int): The column index of the move.
+        board_with_all_moves (List[List[str]]): The board showing all moves.
+        board_with_hidden_moves (List[List[str]]): The board with hidden moves.
+        current_player_symbol (str): The symbol of the current player.
+        empty_tile (str): The symbol representing an empty tile.
+        blocked_tile (str): The symbol representing a blocked tile.
+        changes (list): If given, records the revealed tiles (see `reveal_moves`).
+
+    Returns:
+        bool: True if the tile was blocked, False if the symbol was placed.
+    """
+    if board_with_all_moves[row][col] != empty_tile:
+        board_with_all_moves[row][col] = blocked_tile
+        reveal_moves(board_with_all_moves, board_with_hidden_moves, changes)
+        return True
+    board_with_all_moves[row][col] = current_player_symbol
+    return False
+
+
+def clear_blocked_tiles(board_with_all_moves: List[List[str]], board_with_hidden_moves: List[List[str]],
+                        empty_tile: str, blocked_tile: str, changes: Optional[list] = None) -> None:
+    """
+    Clears the blocked tiles of a full board and empties the hidden board, so the game can continue.
+
+    Args:
+        board_with_all_moves (List[List[str]]): The board showing all moves.
+        board_with_hidden_moves (List[List[str]]): The board with hidden moves.
+        empty_tile (str): The symbol representing an empty tile.
+        blocked_tile (str): The symbol representing a blocked tile.
+        changes (list): If given, (board, i, j, previous tile) is appended for every changed tile.
+    """
+    for i, (row, hidden_row) in enumerate(zip(board_with_all_moves, board_with_hidden_moves)):
+        for j in range(len(row)):
+            if row[j] == blocked_tile:
+                if changes is not None:
+                    changes.append((board_with_all_moves, i, j, blocked_tile))
+                row[j] = empty_tile
+            if hidden_row[j] != empty_tile:
+                if changes is not None:
+                    changes.append((board_with_hidden_moves, i, j, hidden_row[j]))
+                hidden_row[j] = empty_tile
+
+
 def process_validated_move(row: int, col: int, board_with_all_moves: List[List[str]], 
                            board_with_hidden_moves: List[List[str]], current_player_symbol: str, 
                            empty_tile: str, blocked_tile: str) -> tuple:
@@ -209,6 +315,9 @@ def process_validated_move(row: int, col: int, board_with_all_moves: List[List[s
     Process an already validated move on the board. If the selected tile is not empty, block it.
     Otherwise, place the current player's symbol.
 
+    The game loop plays moves through `GameState.push`; this wrapper applies the same
+    rules (`place_move`) and prints the messages of a single move.
+
     Args:
         row (int): The row index of the move.
         col (int): The column index of the move.
@@ -221,15 +330,12 @@ def process_validated_move(row: int, col: int, board_with_all_moves: List[List[s
     Returns:
         tuple: A tuple containing the updated boards and the increment in performed moves.
     """
-    if board_with_all_moves[row][col] != empty_tile:
-        board_with_all_moves[row][col] = blocked_tile
-        board_with_hidden_moves = deepcopy(board_with_all_moves)
+    if place_move(row, col, board_with_all_moves, board_with_hidden_moves, current_player_symbol,
+                  empty_tile, blocked_tile):
         print(f"Hit a non-empty tile. It is now permanently blocked. Previous moves can be seen on board.")
-        return board_with_all_moves, board_with_hidden_moves, 1
     else:
-        board_with_all_moves[row][col] = current_player_symbol
         clear_screen()
-        return board_with_all_moves, board_with_hidden_moves, 1
+    return board_with_all_moves, board_with_hidden_moves, 1
 
 
 def check_game_status(board_with_all_moves: List[List[str]], 
@@ -241,6 +347,9 @@ def check_game_status(board_with_all_moves: List[List[str]],
     Checks the current status of the game to determine if a player has won, 
     the game is a draw, or it should continue.
 
+    The game loop tracks the status through `GameState.push`; this wrapper applies the same
+    rules (`clear_blocked_tiles` on a full board) to a pair of boards and prints the result.
+
     Args:
         board_with_all_moves (List[List[str]]): The main game board showing all moves.
         board_hidden_moves (List[List[str]]): The hidden board used for additional game logic.
@@ -261,8 +370,7 @@ def check_game_status(board_with_all_moves: List[List[str]],
     if is_board_full(board_with_all_moves, empty_tile):
         if any(blocked_tile in row for row in board_with_all_moves):
             print("Clearing blocked tiles and continuing the game.")
-            clear_tiles(board_with_all_moves, blocked_tile, empty_tile)
-            clear_tiles(board_hidden_moves, blocked_tile, empty_tile, clear_all=True)
+            clear_blocked_tiles(board_with_all_moves, board_hidden_moves, empty_tile, blocked_tile)
             return "continue"
         else:
             print("It's a draw!")
@@ -286,12 +394,274 @@ def switch_player(current_player: str, first_symbol: str, second_symbol: str) ->
     return first_symbol if current_player == second_symbol else second_symbol
 
 
-def game(first_symbol: str, second_symbol: str, board_size: int, empty_tile: str, blocked_tile: str) -> str:
+class MoveRecord(NamedTuple):
+    """
+    Undo record of one move on `GameState.history`.
+
+    Attributes:
+        row (int): The row index of the move.
+        col (int): The column index of the move.
+        symbol (str): The symbol of the player who moved.
+        previous_tile (str): The tile at (row, col) of the board with all moves before the move.
+        blocked (bool): True if the move hit a non-empty tile and blocked it.
+        cleared (bool): True if the move filled the board and blocked tiles were cleared.
+        empty_count (int): The number of empty tiles before the move.
+        blocked_count (int): The number of blocked tiles before the move.
+        changes (list): (board, i, j, previous tile) for every other tile the move changed.
+    """
+    row: int
+    col: int
+    symbol: str
+    previous_tile: str
+    blocked: bool
+    cleared: bool
+    empty_count: int
+    blocked_count: int
+    changes: list
+
+
+class GameState:
+    """
+    Complete state of one game with a make/unmake move API.
+
+    `push` applies a move with the rules shared with `process_validated_move` and
+    `check_game_status` (`place_move`, `clear_blocked_tiles` on a full board, revealing
+    after three moves) without printing, and records every changed
+    tile on an undo stack. `pop` reverses the last move exactly, so search can explore
+    many positions on the same two boards without copying them.
+    """
+
+    def __init__(self, first_symbol: str, second_symbol: str, board_size: int,
+                 empty_tile: str, blocked_tile: str) -> None:
+        """
+        Args:
+            first_symbol (str): Symbol for a player who starts the game.
+            second_symbol (str): Symbol for a player who goes next.
+            board_size (int): The size of the board (number of rows and columns).
+            empty_tile (str): The symbol representing an empty tile.
+            blocked_tile (str): The symbol representing a blocked tile.
+        """
+        self.first_symbol = first_symbol
+        self.second_symbol = second_symbol
+        self.board_size = board_size
+        self.empty_tile = empty_tile
+        self.blocked_tile = blocked_tile
+        self.board_with_all_moves = create_board(board_size, empty_tile)
+        self.board_with_hidden_moves = create_board(board_size, empty_tile)
+        self.current_player_symbol = first_symbol
+        self.performed_moves = 0
+        self.status = "continue"
+        self.empty_count = board_size * board_size
+        self.blocked_count = 0
+        self.history = []
+
+    @classmethod
+    def from_boards(cls, board_with_all_moves: List[List[str]], board_with_hidden_moves: List[List[str]],
+                    current_player_symbol: str, other_player_symbol: str, empty_tile: str,
+                    blocked_tile: str, performed_moves: int, copy_boards: bool = True,
+                    first_symbol: Optional[str] = None, second_symbol: Optional[str] = None) -> "GameState":
+        """
+        Creates a game state from an arbitrary position.
+
+        Args:
+            board_with_all_moves (List[List[str]]): The board showing all moves.
+            board_with_hidden_moves (List[List[str]]): The board with hidden moves.
+            current_player_symbol (str): The symbol of the player to move.
+            other_player_symbol (str): The symbol of the other player.
+            empty_tile (str): The symbol representing an empty tile.
+            blocked_tile (str): The symbol representing a blocked tile.
+            performed_moves (int): The number of moves performed so far.
+            copy_boards (bool): Whether to copy the boards; pass False to hand over freshly built boards.
+            first_symbol (str): The symbol of the player who started the game (defaults to the player to move).
+            second_symbol (str): The symbol of the player who went next (defaults to the other player).
+
+        Returns:
+            GameState: The game state of the position, with an empty undo stack.
+        """
+        state = cls(first_symbol or current_player_symbol, second_symbol or other_player_symbol,
+                    len(board_with_all_moves), empty_tile, blocked_tile)
+        state.current_player_symbol = current_player_symbol
+        if copy_boards:
+            board_with_all_moves = deepcopy(board_with_all_moves)
+            board_with_hidden_moves = deepcopy(board_with_hidden_moves)
+        state.board_with_all_moves = board_with_all_moves
+        state.board_with_hidden_moves = board_with_hidden_moves
+        state.performed_moves = performed_moves
+        state.empty_count = sum(row.count(empty_tile) for row in board_with_all_moves)
+        state.blocked_count = sum(row.count(blocked_tile) for row in board_with_all_moves)
+        for symbol in (current_player_symbol, other_player_symbol):
+            if check_win(board_with_all_moves, symbol):
+                state.status = symbol
+        if state.status == "continue" and state.empty_count == 0 and state.blocked_count == 0:
+            state.status = "draw"
+        return state
+
+    def push(self, row: int, col: int) -> str:
+        """
+        Plays a move of the current player and records it on the undo stack.
+
+        Args:
+            row (int): The row index of the move (0-based).
+            col (int): The column index of the move (0-based).
+
+        Returns:
+            str: The status of the game after the move: the winner's symbol, "draw" or "continue".
+        """
+        if self.status != "continue":
+            raise ValueError(f"The game is already over: {self.status}.")
+
+        board = self.board_with_all_moves
+        hidden = self.board_with_hidden_moves
+        empty_tile = self.empty_tile
+        blocked_tile = self.blocked_tile
+        symbol = self.current_player_symbol
+        # Every other changed tile is recorded in the undo record (see `MoveRecord`)
+        changes = []
+        empty_count = self.empty_count
+        blocked_count = self.blocked_count
+        previous_tile = board[row][col]
+        cleared = False
+
+        blocked = place_move(row, col, board, hidden, symbol, empty_tile, blocked_tile, changes)
+        if blocked:
+            self.blocked_count += 1
+        else:
+            self.empty_count -= 1
+        self.performed_moves += 1
+
+        if not blocked and check_win_at(board, row, col, symbol):
+            self.status = symbol
+        elif self.empty_count == 0:
+            if self.blocked_count:
+                cleared = True
+                clear_blocked_tiles(board, hidden, empty_tile, blocked_tile, changes)
+                self.empty_count = self.blocked_count
+                self.blocked_count = 0
+            else:
+                self.status = "draw"
+
+        if self.status == "continue":
+            if self.performed_moves == 3 and not any(blocked_tile in hidden_row for hidden_row in hidden):
+                reveal_moves(board, hidden, changes)
+            self.current_player_symbol = switch_player(symbol, self.first_symbol, self.second_symbol)
+
+        self.history.append(MoveRecord(row, col, symbol, previous_tile, blocked, cleared,
+                                       empty_count, blocked_count, changes))
+        return self.status
+
+    def pop(self) -> tuple:
+        """
+        Takes back the last move, restoring both boards, counters and the current player.
+
+        Returns:
+            tuple: The (row, col) of the move that was taken back.
+        """
+        if not self.history:
+            raise IndexError("No move to undo.")
+        record = self.history.pop()
+        for board, i, j, tile in reversed(record.changes):
+            board[i][j] = tile
+        self.board_with_all_moves[record.row][record.col] = record.previous_tile
+        self.empty_count = record.empty_count
+        self.blocked_count = record.blocked_count
+        self.performed_moves -= 1
+        self.current_player_symbol = record.symbol
+        self.status = "continue"
+        return record.row, record.col
+
+    @property
+    def last_move_blocked(self) -> bool:
+        """
+        bool: True if the last move hit a non-empty tile and blocked it.
+        """
+        return bool(self.history) and self.history[-1].blocked
+
+    @property
+    def last_move_cleared(self) -> bool:
+        """
+        bool: True if the last move filled the board and blocked tiles were cleared.
+        """
+        return bool(self.history) and self.history[-1].cleared
+
+
+def play_game(state: GameState, choose_move: Callable[[GameState], Optional[tuple]],
+              human_symbols: tuple, on_move: Optional[Callable[[GameState], None]] = None) -> str:
+    """
+    Runs the interactive game loop on a game state.
+
+    Args:
+        state (GameState): The game state to play on.
+        choose_move (Callable): Returns the (row, col) of the current player's move,
+            or None if a human asked to undo.
+        human_symbols (tuple): Symbols of the human players. Undo takes back moves until
+            a human is to move again.
+        on_move (Callable): Called with the state after every move and undo, e.g. to checkpoint.
+
+    Returns:
+        str: Symbol of the winning player or "draw".
+    """
+    while state.status == "continue":
+        print(format_board(state.board_with_hidden_moves))
+        print(f"Performed moves: {state.performed_moves}")
+        if state.performed_moves < 3:
+            print("After three moves have been made, the previous moves will be revealed.")
+
+        print(f"Player {state.current_player_symbol}'s turn.")
+        move = choose_move(state)
+        if move is None:
+            if not state.history:
+                print("No move to undo.")
+                continue
+            state.pop()
+            while state.history and state.current_player_symbol not in human_symbols:
+                state.pop()
+            clear_screen()
+            print("Last move undone.")
+            if on_move:
+                on_move(state)
+            continue
+
+        row, col = move
+        status = state.push(row, col)
+        if state.last_move_blocked:
+            print(f"Hit a non-empty tile. It is now permanently blocked. Previous moves can be seen on board.")
+        else:
+            clear_screen()
+
+        if status == "draw":
+            print("It's a draw!")
+        elif status != "continue":
+            print(f"Player {status} wins!")
+        elif state.last_move_cleared:
+            print("Clearing blocked tiles and continuing the game.")
+        if on_move:
+            on_move(state)
+
+    print(format_board(state.board_with_all_moves))
+    return state.status
+
+
+def human_move(state: GameState) -> Optional[tuple]:
+    """
+    Asks the current human player for a move on the hidden board.
+
+    Args:
+        state (GameState): The game state.
+
+    Returns:
+        tuple: The valid (row, col) of the move, or None if the player asked to undo.
+    """
+    return get_valid_move(state.board_with_hidden_moves, state.empty_tile, allow_undo=True)
+
+
+def game(first_symbol: str, second_symbol: str, board_size: int, empty_tile: str, blocked_tile: str,
+         state: Optional[GameState] = None,
+         on_move: Optional[Callable[[GameState], None]] = None) -> str:
     """
     Main function to run the Tic Tac Toe game.
     
     This function initializes the game board, manages player turns, and handles
-    the game loop, including win/draw detection and prompting for a replay.
+    the game loop, including win/draw detection and undoing moves.
     
     Args:
         first_symbol (str): Symbol for a player who starts the game.
@@ -299,47 +669,24 @@ def game(first_symbol: str, second_symbol: str, board_size: int, empty_tile: str
         board_size (int): The size of the board (number of rows and columns).
         empty_tile (str): The symbol representing an empty tile.
         blocked_tile (str): The symbol representing a blocked tile.
+        state (GameState): A game in progress to resume instead of starting a new one;
+            its own board size is used.
+        on_move (Callable): Called with the state after every move, e.g. to checkpoint.
     
     Returns:
         str: Symbol of the winning player or "draw".
     """
-    board_with_all_moves = create_board(board_size, empty_tile)
-    board_with_hidden_moves = deepcopy(board_with_all_moves)
-    current_player_symbol = first_symbol
-    game_over = False
-    performed_moves = 0
+    state = state or GameState(first_symbol, second_symbol, board_size, empty_tile, blocked_tile)
 
     input("Press Enter to start the game...")
     clear_screen()
 
-    while not game_over:
-        if performed_moves == 3 and not any(blocked_tile in row for row in board_with_hidden_moves):
-            board_with_hidden_moves = deepcopy(board_with_all_moves)
-
-        print(format_board(board_with_hidden_moves))
-        print(f"Performed moves: {performed_moves}")
-        if performed_moves < 3:
-            print("After three moves have been made, the previous moves will be revealed.")
-
-        print(f"Player {current_player_symbol}'s turn.")
-        row, col = get_valid_move(board_with_hidden_moves, empty_tile)
-        board_with_all_moves, board_with_hidden_moves, move_increment = process_validated_move(
-            row, col, board_with_all_moves, board_with_hidden_moves, current_player_symbol, empty_tile, blocked_tile
-        )
-        performed_moves += move_increment
-
-        status = check_game_status(board_with_all_moves, board_with_hidden_moves, current_player_symbol, empty_tile, blocked_tile)
-        if status in [first_symbol, second_symbol, "draw"]:
-            print(format_board(board_with_all_moves))
-            return status
+    return play_game(state, human_move, (first_symbol, second_symbol), on_move)
 
-        current_player_symbol = switch_player(current_player_symbol, first_symbol, second_symbol)
 
-    print("Game ended unexpectedly. No winner. It's a draw.")
-    return "draw"
-
-
-def game_vs_random_computer(player_symbol: str, computer_symbol: str, board_size: int, empty_tile: str, blocked_tile: str) -> str:
+def game_vs_random_computer(player_symbol: str, computer_symbol: str, board_size: int, empty_tile: str, blocked_tile: str,
+                            state: Optional[GameState] = None,
+                            on_move: Optional[Callable[[GameState], None]] = None) -> str:
     """
     Variant of the game where the player plays against a random-move computer.
 
@@ -349,62 +696,74 @@ def game_vs_random_computer(player_symbol: str, computer_symbol: str, board_size
         board_size (int): The size of the board (number of rows and columns).
         empty_tile (str): The symbol representing an empty tile.
         blocked_tile (str): The symbol representing a blocked tile.
+        state (GameState): A game in progress to resume instead of starting a new one;
+            its own board size is used.
+        on_move (Callable): Called with the state after every move, e.g. to checkpoint.
 
     Returns:
         str: Symbol of the winning player or "draw".
     """
-    board_with_all_moves = create_board(board_size, empty_tile)
-    board_with_hidden_moves = deepcopy(board_with_all_moves)
-    current_player_symbol = player_symbol
-    game_over = False
-    performed_moves = 0
+    from src.batch import computer_move
+
+    def choose_move(state):
+        if state.current_player_symbol == player_symbol:
+            return human_move(state)
+        # Computer move: pick a random empty tile of the hidden board
+        return computer_move(state, "random")
+
+    state = state or GameState(player_symbol, computer_symbol, board_size, empty_tile, blocked_tile)
 
     input("Press Enter to start the game against the computer...")
     clear_screen()
 
-    while not game_over:
-        if performed_moves == 3 and not any(blocked_tile in row for row in board_with_hidden_moves):
-            board_with_hidden_moves = deepcopy(board_with_all_moves)
+    return play_game(state, choose_move, (player_symbol,), on_move)
 
-        print(format_board(board_with_hidden_moves))
-        print(f"Performed moves: {performed_moves}")
-        if performed_moves < 3:
-            print("After three moves have been made, the previous moves will be revealed.")
 
-        print(f"Player {current_player_symbol}'s turn.")
+def game_vs_smart_computer(player_symbol: str, computer_symbol: str, board_size: int, empty_tile: str, blocked_tile: str,
+                           state: Optional[GameState] = None,
+                           on_move: Optional[Callable[[GameState], None]] = None) -> str:
+    """
+    Variant of the game where the player plays against a smarter computer.
+    The computer will try to win if possible, block the player if needed, otherwise pick randomly.
 
-        if current_player_symbol == player_symbol:
-            row, col = get_valid_move(board_with_hidden_moves, empty_tile)
-        else:
-            # Computer move: pick a random empty tile
-            empty_positions = [
-                (i, j)
-                for i in range(board_size)
-                for j in range(board_size)
-                if board_with_hidden_moves[i][j] == empty_tile
-            ]
-            row, col = random.choice(empty_positions)
+    Args:
+        player_symbol (str): Symbol for the human player.
+        computer_symbol (str): Symbol for the computer.
+        board_size (int): The size of the board (number of rows and columns).
+        empty_tile (str): The symbol representing an empty tile.
+        blocked_tile (str): The symbol representing a blocked tile.
+        state (GameState): A game in progress to resume instead of starting a new one;
+            its own board size is used.
+        on_move (Callable): Called with the state after every move, e.g. to checkpoint.
 
-        board_with_all_moves, board_with_hidden_moves, move_increment = process_validated_move(
-            row, col, board_with_all_moves, board_with_hidden_moves, current_player_symbol, empty_tile, blocked_tile
-        )
-        performed_moves += move_increment
+    Returns:
+        str: Symbol of the winning player or "draw".
+    """
+    from src.batch import computer_move
 
-        status = check_game_status(board_with_all_moves, board_with_hidden_moves, current_player_symbol, empty_tile, blocked_tile)
-        if status in [player_symbol, computer_symbol, "draw"]:
-            print(format_board(board_with_all_moves))
-            return status
+    def choose_move(state):
+        if state.current_player_symbol == player_symbol:
+            return human_move(state)
+        # Smart computer logic: win if possible, block the player if needed, otherwise pick randomly
+        row, col = computer_move(state, "smart")
+        print(f"Computer chooses: {chr(65 + col)}{row + 1}")
+        return row, col
 
-        current_player_symbol = switch_player(current_player_symbol, player_symbol, computer_symbol)
+    state = state or GameState(player_symbol, computer_symbol, board_size, empty_tile, blocked_tile)
 
-    print("Game ended unexpectedly. No winner. It's a draw.")
-    return "draw"
+    input("Press Enter to start the game against the smart computer...")
+    clear_screen()
+
+    return play_game(state, choose_move, (player_symbol,), on_move)
 
 
-def game_vs_smart_computer(player_symbol: str, computer_symbol: str, board_size: int, empty_tile: str, blocked_tile: str) -> str:
+def game_vs_threat_computer(player_symbol: str, computer_symbol: str, board_size: int, empty_tile: str, blocked_tile: str,
+                            state: Optional[GameState] = None,
+                            on_move: Optional[Callable[[GameState], None]] = None) -> str:
     """
-    Variant of the game where the player plays against a smarter computer.
-    The computer will try to win if possible, block the player if needed, otherwise pick randomly.
+    Variant of the game where the player plays against a computer that scores every tile by
+    the open lines it builds on or blocks (see `src.threats`). Wins and blocks come first,
+    otherwise the computer plays the most threatening tile. Suited to large boards.
 
     Args:
         player_symbol (str): Symbol for the human player.
@@ -412,74 +771,27 @@ def game_vs_smart_computer(player_symbol: str, computer_symbol: str, board_size:
         board_size (int): The size of the board (number of rows and columns).
         empty_tile (str): The symbol representing an empty tile.
         blocked_tile (str): The symbol representing a blocked tile.
+        state (GameState): A game in progress to resume instead of starting a new one;
+            its own board size is used.
+        on_move (Callable): Called with the state after every move, e.g. to checkpoint.
 
     Returns:
         str: Symbol of the winning player or "draw".
     """
-    def find_winning_move(board, symbol):
-        # Try all empty positions, return the first that leads to a win
-        for i in range(board_size):
-            for j in range(board_size):
-                if board[i][j] == empty_tile:
-                    board[i][j] = symbol
-                    if check_win(board, symbol):
-                        board[i][j] = empty_tile
-                        return (i, j)
-                    board[i][j] = empty_tile
-        return None
-
-    board_with_all_moves = create_board(board_size, empty_tile)
-    board_with_hidden_moves = deepcopy(board_with_all_moves)
-    current_player_symbol = player_symbol
-    game_over = False
-    performed_moves = 0
+    from src.threats import ThreatEvaluator
 
-    input("Press Enter to start the game against the smart computer...")
-    clear_screen()
+    state = state or GameState(player_symbol, computer_symbol, board_size, empty_tile, blocked_tile)
+    evaluator = ThreatEvaluator(state.board_size, computer_symbol, player_symbol, empty_tile, blocked_tile)
+    evaluator.attach(state)
 
-    while not game_over:
-        if performed_moves == 3 and not any(blocked_tile in row for row in board_with_hidden_moves):
-            board_with_hidden_moves = deepcopy(board_with_all_moves)
+    def choose_move(state):
+        if state.current_player_symbol == player_symbol:
+            return human_move(state)
+        row, col = evaluator.best_move(state)
+        print(f"Computer chooses: {chr(65 + col)}{row + 1}")
+        return row, col
 
-        print(format_board(board_with_hidden_moves))
-        print(f"Performed moves: {performed_moves}")
-        if performed_moves < 3:
-            print("After three moves have been made, the previous moves will be revealed.")
-
-        print(f"Player {current_player_symbol}'s turn.")
+    input("Press Enter to start the game against the threat-aware computer...")
+    clear_screen()
 
-        if current_player_symbol == player_symbol:
-            row, col = get_valid_move(board_with_hidden_moves, empty_tile)
-        else:
-            # Smart computer logic
-            # 1. Win if possible
-            move = find_winning_move(board_with_all_moves, computer_symbol)
-            # 2. Block player if possible
-            if move is None:
-                move = find_winning_move(board_with_all_moves, player_symbol)
-            # 3. Otherwise, pick random
-            if move is None:
-                empty_positions = [
-                    (i, j)
-                    for i in range(board_size)
-                    for j in range(board_size)
-                    if board_with_hidden_moves[i][j] == empty_tile
-                ]
-                move = random.choice(empty_positions)
-            row, col = move
-            print(f"Computer chooses: {chr(65 + col)}{row + 1}")
-
-        board_with_all_moves, board_with_hidden_moves, move_increment = process_validated_move(
-            row, col, board_with_all_moves, board_with_hidden_moves, current_player_symbol, empty_tile, blocked_tile
-        )
-        performed_moves += move_increment
-
-        status = check_game_status(board_with_all_moves, board_with_hidden_moves, current_player_symbol, empty_tile, blocked_tile)
-        if status in [player_symbol, computer_symbol, "draw"]:
-            print(format_board(board_with_all_moves))
-            return status
-
-        current_player_symbol = switch_player(current_player_symbol, player_symbol, computer_symbol)
-
-    print("Game ended unexpectedly. No winner. It's a draw.")
-    return "draw"
+    return play_game(state, choose_move, (player_symbol,), on_move)
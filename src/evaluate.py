@@ -0,0 +1,330 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from statistics import NormalDist
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+import math
+import os
+import random
+import time
+
+from src.batch import computer_move, winning_cells
+from src.bitboard import cell_line_masks, full_mask, has_line, line_masks, mask_to_cells
+from src.deftoe import GameState
+
+"""
+Evaluation module for Tic Tac Toe game.
+This module estimates the outcome probabilities of a position by Monte Carlo playouts.
+Playouts run in batches across a process pool on a single `GameState` per batch
+(moves are pushed and popped, boards are never copied), partial results are streamed
+back as batches finish and sampling stops once the confidence interval is narrow enough.
+"""
+
+POLICIES = ("random", "smart")
+# Outcome indices of `mask_playout`
+FIRST_WINS, SECOND_WINS, DRAW = range(3)
+
+
+class Evaluation(NamedTuple):
+    """
+    Aggregated result of the playouts performed so far.
+
+    Attributes:
+        outcomes (Dict[str, int]): Number of playouts won by each symbol and ended as "draw".
+        playouts (int): Total number of playouts.
+        margin (float): Largest half-width of the confidence intervals of the outcome probabilities.
+        seconds (float): Wall-clock time spent so far.
+    """
+    outcomes: Dict[str, int]
+    playouts: int
+    margin: float
+    seconds: float
+
+    @property
+    def probabilities(self) -> Dict[str, float]:
+        """
+        Dict[str, float]: Estimated probability of every outcome.
+        """
+        return {outcome: count / self.playouts if self.playouts else 0.0 for outcome, count in self.outcomes.items()}
+
+    @property
+    def playouts_per_second(self) -> float:
+        """
+        float: Playout throughput.
+        """
+        return self.playouts / self.seconds if self.seconds else 0.0
+
+
+def wilson_margin(successes: int, trials: int, confidence: float) -> float:
+    """
+    Computes the half-width of the Wilson score interval of a proportion.
+
+    Args:
+        successes (int): Number of successes.
+        trials (int): Number of trials.
+        confidence (float): Confidence level, e.g. 0.95.
+
+    Returns:
+        float: Half-width of the interval (1.0 if there are no trials).
+    """
+    if trials == 0:
+        return 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    p = successes / trials
+    return z / (1 + z * z / trials) * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+
+
+def playout(state: GameState, policy: str, rng: random.Random, max_moves: int) -> str:
+    """
+    Plays one game to the end from the current state and takes all its moves back.
+
+    Args:
+        state (GameState): The position to play from. It is restored before returning.
+        policy (str): "random" picks random empty tiles of the hidden board, "smart"
+            wins or blocks when possible, like the smart computer.
+        rng (random.Random): Random generator for the moves.
+        max_moves (int): Playouts still running after this many moves count as a draw.
+
+    Returns:
+        str: Symbol of the winning player or "draw".
+    """
+    depth = 0
+    while state.status == "continue" and depth < max_moves:
+        row, col = computer_move(state, policy, rng)
+        state.push(row, col)
+        depth += 1
+
+    result = state.status if state.status != "continue" else "draw"
+    for _ in range(depth):
+        state.pop()
+    return result
+
+
+def default_max_moves(board_size: int) -> int:
+    """
+    Returns the default move limit of a playout: ten times the number of tiles.
+
+    Args:
+        board_size (int): The size of the board (number of rows and columns).
+
+    Returns:
+        int: The move limit.
+    """
+    return 10 * board_size * board_size
+
+
+def count_playouts(state: GameState, policy: str, count: int, rng: random.Random, max_moves: int) -> Dict[str, int]:
+    """
+    Runs playouts from a position and counts the outcomes.
+
+    Args:
+        state (GameState): The position to play from. It is restored before returning.
+        policy (str): Either "random" or "smart" (see `playout`).
+        count (int): Number of playouts.
+        rng (random.Random): Random generator for the moves.
+        max_moves (int): Move limit per playout.
+
+    Returns:
+        dict: Number of playouts won by the first symbol, the second symbol and ended as "draw".
+    """
+    outcomes = {state.first_symbol: 0, state.second_symbol: 0, "draw": 0}
+    for _ in range(count):
+        outcomes[playout(state, policy, rng, max_moves)] += 1
+    return outcomes
+
+
+def mask_playout(board_size: int, masks: Sequence[int], current: int, performed_moves: int,
+                 policy: str, rng: random.Random, max_moves: int) -> int:
+    """
+    Plays one game to the end on bitmasks with the rules of `GameState.push` and the
+    policies of `batch.computer_move`. It draws the same random numbers as `playout`,
+    so both give the same outcome for the same position and random generator.
+
+    Args:
+        board_size (int): The size of the board (number of rows and columns).
+        masks (Sequence[int]): Masks of the first player's stones, the second player's stones
+            and the blocked tiles of the board with all moves, followed by the same three
+            masks of the hidden board.
+        current (int): The player to move: 0 for the first player, 1 for the second.
+        performed_moves (int): The number of moves performed so far.
+        policy (str): Either "random" or "smart" (see `playout`).
+        rng (random.Random): Random generator for the moves.
+        max_moves (int): Playouts still running after this many moves count as a draw.
+
+    Returns:
+        int: `FIRST_WINS`, `SECOND_WINS` or `DRAW`.
+    """
+    stones = [masks[0], masks[1]]
+    blocked = masks[2]
+    hidden_stones, hidden_blocked = masks[3] | masks[4], masks[5]
+    full = full_mask(board_size)
+    lines = line_masks(board_size)
+    lines_through = cell_line_masks(board_size)
+    smart = policy == "smart"
+
+    for player in (current, 1 - current):
+        if has_line(stones[player], board_size):
+            return player
+    if not blocked and not full & ~(stones[0] | stones[1]):
+        return DRAW
+
+    for _ in range(max_moves):
+        own, other = stones[current], stones[1 - current]
+        occupied = own | other | blocked
+        target = 0
+        if smart:
+            empty = full & ~occupied
+            target = winning_cells(own, empty, lines) or winning_cells(other, empty, lines)
+        if target:
+            bit = target & -target
+            cell = bit.bit_length() - 1
+        else:
+            cell = rng.choice(mask_to_cells(full & ~(hidden_stones | hidden_blocked)))
+            bit = 1 << cell
+        performed_moves += 1
+
+        if bit & occupied:
+            # Hitting a non-empty tile blocks it and reveals all moves
+            stones[0] &= ~bit
+            stones[1] &= ~bit
+            blocked |= bit
+            hidden_stones, hidden_blocked = stones[0] | stones[1], blocked
+        else:
+            own |= bit
+            stones[current] = own
+            if any(own & line == line for line in lines_through[cell]):
+                return current
+        if not full & ~(stones[0] | stones[1] | blocked):
+            if not blocked:
+                return DRAW
+            blocked = hidden_stones = hidden_blocked = 0
+        if performed_moves == 3 and not hidden_blocked:
+            hidden_stones, hidden_blocked = stones[0] | stones[1], blocked
+        current = 1 - current
+    return DRAW
+
+
+def count_mask_playouts(board_size: int, masks: Sequence[int], current: int, performed_moves: int,
+                        policy: str, count: int, rng: random.Random, max_moves: int) -> List[int]:
+    """
+    Runs `mask_playout` repeatedly from a position and counts the outcomes.
+
+    Returns:
+        list: Number of playouts won by the first player, won by the second player and drawn.
+    """
+    outcomes = [0, 0, 0]
+    for _ in range(count):
+        outcomes[mask_playout(board_size, masks, current, performed_moves, policy, rng, max_moves)] += 1
+    return outcomes
+
+
+def _run_playouts(state: GameState, policy: str, count: int, seed: Optional[int], max_moves: int) -> Dict[str, int]:
+    """
+    Worker function: runs a batch of playouts and counts the outcomes.
+    """
+    return count_playouts(state, policy, count, random.Random(seed), max_moves)
+
+
+def iter_evaluation(board_with_all_moves: List[List[str]], board_with_hidden_moves: List[List[str]],
+                    current_player_symbol: str, other_player_symbol: str, empty_tile: str, blocked_tile: str,
+                    performed_moves: int = 3, policy: str = "random", tolerance: float = 0.01,
+                    confidence: float = 0.95, max_playouts: int = 100000, batch_size: int = 500,
+                    workers: Optional[int] = None, seed: Optional[int] = None,
+                    max_moves: Optional[int] = None) -> Iterator[Evaluation]:
+    """
+    Estimates the outcome probabilities of a position, yielding the running estimate
+    after every finished batch of playouts.
+
+    Sampling stops once the confidence intervals of all outcome probabilities are narrower
+    than `tolerance` (half-width) or `max_playouts` is reached.
+
+    Args:
+        board_with_all_moves (List[List[str]]): The board showing all moves.
+        board_with_hidden_moves (List[List[str]]): The board with hidden moves.
+        current_player_symbol (str): The symbol of the player to move.
+        other_player_symbol (str): The symbol of the other player.
+        empty_tile (str): The symbol representing an empty tile.
+        blocked_tile (str): The symbol representing a blocked tile.
+        performed_moves (int): The number of moves performed so far (3 or more means the
+            reveal after three moves will not happen again).
+        policy (str): Either "random" or "smart" (see `playout`).
+        tolerance (float): Requested half-width of the confidence intervals.
+        confidence (float): Confidence level of the intervals.
+        max_playouts (int): Upper bound on the number of playouts.
+        batch_size (int): Number of playouts per batch sent to a worker.
+        workers (int): Number of worker processes; None uses all CPUs, 0 runs in this process.
+        seed (int): Seed for reproducible batches.
+        max_moves (int): Move limit per playout (default ten times the number of tiles).
+
+    Yields:
+        Evaluation: The aggregated result after each batch.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy!r}. Expected one of {POLICIES}.")
+    state = GameState.from_boards(board_with_all_moves, board_with_hidden_moves, current_player_symbol,
+                                  other_player_symbol, empty_tile, blocked_tile, performed_moves)
+    if max_moves is None:
+        max_moves = default_max_moves(state.board_size)
+    outcomes = {current_player_symbol: 0, other_player_symbol: 0, "draw": 0}
+    start = time.perf_counter()
+    submitted = 0
+    batch_index = 0
+
+    def next_batch():
+        nonlocal submitted, batch_index
+        count = min(batch_size, max_playouts - submitted)
+        batch_seed = None if seed is None else seed * 1000003 + batch_index
+        submitted += count
+        batch_index += 1
+        return count, batch_seed
+
+    def aggregate(batch_outcomes):
+        for outcome, count in batch_outcomes.items():
+            outcomes[outcome] += count
+        playouts = sum(outcomes.values())
+        margin = max(wilson_margin(count, playouts, confidence) for count in outcomes.values())
+        return Evaluation(dict(outcomes), playouts, margin, time.perf_counter() - start)
+
+    if workers == 0:
+        while submitted < max_playouts:
+            count, batch_seed = next_batch()
+            evaluation = aggregate(_run_playouts(state, policy, count, batch_seed, max_moves))
+            yield evaluation
+            if evaluation.margin < tolerance:
+                return
+        return
+
+    workers = workers or os.cpu_count() or 1
+    # The executor is shut down without waiting, so stopping early (or a consumer leaving the
+    # loop) does not block on the batches still running; they finish in the background.
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = set()
+    try:
+        in_flight = 2 * workers
+        while submitted < max_playouts and len(pending) < in_flight:
+            pending.add(executor.submit(_run_playouts, state, policy, *next_batch(), max_moves))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                evaluation = aggregate(future.result())
+                yield evaluation
+                if evaluation.margin < tolerance:
+                    return
+                if submitted < max_playouts:
+                    pending.add(executor.submit(_run_playouts, state, policy, *next_batch(), max_moves))
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def evaluate_position(*args, **kwargs) -> Evaluation:
+    """
+    Runs `iter_evaluation` to completion and returns the final estimate.
+    Accepts the same arguments as `iter_evaluation`.
+
+    Returns:
+        Evaluation: The final aggregated result.
+    """
+    evaluation = None
+    for evaluation in iter_evaluation(*args, **kwargs):
+        pass
+    return evaluation
@@ -0,0 +1,226 @@
+from statistics import NormalDist
+from typing import Dict, Iterable, NamedTuple, Tuple
+import json
+import math
+import os
+
+"""
+Rating module for Tic Tac Toe game.
+This module rates computer players with Glicko-2 from a stream of game results.
+Every game is rated as its own rating period, so memory stays constant in the number of
+games: only the current rating of every player and the first-move advantage are kept.
+The advantage of moving first (the starting player alternates via `first_symbol`)
+is learned online and added to the first player's rating when computing expectations.
+"""
+
+GLICKO2_SCALE = 173.7178
+CONVERGENCE = 0.000001
+
+
+class Rating(NamedTuple):
+    """
+    Glicko-2 rating of one player on the usual (Elo-like) scale.
+
+    Attributes:
+        rating (float): Rating, 1500 for a new player.
+        deviation (float): Rating deviation (uncertainty), 350 for a new player.
+        volatility (float): Expected fluctuation of the rating.
+        games (int): Number of rated games.
+    """
+    rating: float = 1500.0
+    deviation: float = 350.0
+    volatility: float = 0.06
+    games: int = 0
+
+
+def _g(phi: float) -> float:
+    """
+    Glicko-2 weighting of the opponent's deviation.
+    """
+    return 1 / math.sqrt(1 + 3 * phi * phi / (math.pi * math.pi))
+
+
+def _expected(mu: float, opponent_mu: float, opponent_phi: float) -> float:
+    """
+    Glicko-2 expected score against an opponent.
+    """
+    return 1 / (1 + math.exp(-_g(opponent_phi) * (mu - opponent_mu)))
+
+
+def _new_volatility(phi: float, sigma: float, delta: float, v: float, tau: float) -> float:
+    """
+    Computes the new volatility with the Illinois algorithm (step 5 of Glicko-2).
+    """
+    a = math.log(sigma * sigma)
+
+    def f(x):
+        ex = math.exp(x)
+        return ex * (delta * delta - phi * phi - v - ex) / (2 * (phi * phi + v + ex) ** 2) - (x - a) / (tau * tau)
+
+    upper = a
+    if delta * delta > phi * phi + v:
+        lower = math.log(delta * delta - phi * phi - v)
+    else:
+        k = 1
+        while f(a - k * tau) < 0:
+            k += 1
+        lower = a - k * tau
+    f_upper, f_lower = f(upper), f(lower)
+    while abs(lower - upper) > CONVERGENCE:
+        middle = upper + (upper - lower) * f_upper / (f_lower - f_upper)
+        f_middle = f(middle)
+        if f_middle * f_lower < 0:
+            upper, f_upper = lower, f_lower
+        else:
+            f_upper /= 2
+        lower, f_lower = middle, f_middle
+    return math.exp(upper / 2)
+
+
+class RatingEngine:
+    """
+    Incremental Glicko-2 ratings of players identified by name, e.g. "random" or "smart".
+    """
+
+    def __init__(self, tau: float = 0.5, advantage_rate: float = 2.0) -> None:
+        """
+        Args:
+            tau (float): Glicko-2 system constant limiting volatility changes.
+            advantage_rate (float): Rating points the first-move advantage moves per unit
+                of unexpected score.
+        """
+        self.tau = tau
+        self.advantage_rate = advantage_rate
+        self.first_move_advantage = 0.0
+        self.ratings: Dict[str, Rating] = {}
+
+    def get(self, player: str) -> Rating:
+        """
+        Returns the rating of a player (the default rating for unknown players).
+
+        Args:
+            player (str): The name of the player.
+
+        Returns:
+            Rating: The current rating.
+        """
+        return self.ratings.get(player, Rating())
+
+    def update(self, first: str, second: str, result: str) -> None:
+        """
+        Rates one game.
+
+        Args:
+            first (str): The name of the player who moved first.
+            second (str): The name of the player who moved second.
+            result (str): The name of the winner, or "draw".
+        """
+        if first == second:
+            raise ValueError("A player cannot be rated against itself.")
+        if result not in (first, second, "draw"):
+            raise ValueError(f"Unexpected result: {result!r}.")
+        first_score = 0.5 if result == "draw" else float(result == first)
+        first_rating, second_rating = self.get(first), self.get(second)
+        advantage = self.first_move_advantage / GLICKO2_SCALE
+
+        self.ratings[first] = self._rate(first_rating, second_rating, first_score, advantage)
+        self.ratings[second] = self._rate(second_rating, first_rating, 1 - first_score, -advantage)
+
+        first_mu = (first_rating.rating - 1500) / GLICKO2_SCALE + advantage
+        second_mu = (second_rating.rating - 1500) / GLICKO2_SCALE
+        combined_phi = math.hypot(first_rating.deviation, second_rating.deviation) / GLICKO2_SCALE
+        surprise = first_score - _expected(first_mu, second_mu, combined_phi)
+        self.first_move_advantage += self.advantage_rate * surprise
+
+    def update_many(self, results: Iterable[Tuple[str, str, str]]) -> int:
+        """
+        Rates a stream of games, e.g. straight from a batch run.
+
+        Args:
+            results (Iterable[Tuple[str, str, str]]): (first, second, result) of every game.
+
+        Returns:
+            int: The number of rated games.
+        """
+        count = 0
+        for first, second, result in results:
+            self.update(first, second, result)
+            count += 1
+        return count
+
+    def interval(self, player: str, confidence: float = 0.95) -> Tuple[float, float]:
+        """
+        Returns the confidence interval of a player's rating.
+
+        Args:
+            player (str): The name of the player.
+            confidence (float): Confidence level of the interval.
+
+        Returns:
+            tuple: Lower and upper bound of the rating.
+        """
+        rating = self.get(player)
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        return rating.rating - z * rating.deviation, rating.rating + z * rating.deviation
+
+    def _rate(self, player: Rating, opponent: Rating, score: float, advantage: float) -> Rating:
+        """
+        Glicko-2 update of one player after a single game; `advantage` is added to the player's
+        strength (negative for the second player).
+        """
+        mu = (player.rating - 1500) / GLICKO2_SCALE
+        phi = player.deviation / GLICKO2_SCALE
+        opponent_mu = (opponent.rating - 1500) / GLICKO2_SCALE
+        opponent_phi = opponent.deviation / GLICKO2_SCALE
+
+        g = _g(opponent_phi)
+        expected = _expected(mu + advantage, opponent_mu, opponent_phi)
+        v = 1 / (g * g * expected * (1 - expected))
+        delta = v * g * (score - expected)
+        sigma = _new_volatility(phi, player.volatility, delta, v, self.tau)
+        phi_star = math.sqrt(phi * phi + sigma * sigma)
+        new_phi = 1 / math.sqrt(1 / (phi_star * phi_star) + 1 / v)
+        new_mu = mu + new_phi * new_phi * g * (score - expected)
+        return Rating(new_mu * GLICKO2_SCALE + 1500, new_phi * GLICKO2_SCALE, sigma, player.games + 1)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the ratings to a JSON file atomically.
+
+        Args:
+            path (str): The ratings file path.
+        """
+        data = {
+            "version": 1,
+            "tau": self.tau,
+            "advantage_rate": self.advantage_rate,
+            "first_move_advantage": self.first_move_advantage,
+            "players": {name: list(rating) for name, rating in self.ratings.items()},
+        }
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "RatingEngine":
+        """
+        Reads ratings written by `save`.
+
+        Args:
+            path (str): The ratings file path.
+
+        Returns:
+            RatingEngine: The engine with the stored ratings.
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != 1:
+            raise ValueError(f"Unsupported ratings version: {data.get('version')}.")
+        engine = cls(data["tau"], data["advantage_rate"])
+        engine.first_move_advantage = data["first_move_advantage"]
+        engine.ratings = {
+            name: Rating(rating, deviation, volatility, int(games))
+            for name, (rating, deviation, volatility, games) in data["players"].items()
+        }
+        return engine
@@ -0,0 +1,319 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+import os
+import random
+import struct
+import time
+
+from src.batch import computer_move
+from src.bitboard import board_to_mask
+from src.deftoe import GameState
+from src.evaluate import count_mask_playouts, count_playouts, default_max_moves
+
+"""
+Shared memory module for Tic Tac Toe game.
+This module keeps batches of game positions as bitmasks in a `multiprocessing.shared_memory`
+buffer. Worker processes read the masks of a position straight from the buffer, play out
+the game on the masks (`evaluate.mask_playout`) and write the results in place, so no
+boards, symbols or game states are pickled, copied or rebuilt between processes.
+
+Layout (little-endian), version 2:
+    header (4sBBHII): magic b"TTTS", version, board size, mask width in bytes, number of
+    games, offset of the results region
+    games: per game six masks of `mask width` bytes (first player stones, second player
+    stones and blocked tiles of the board with all moves, then the same for the hidden
+    board), the player to move (B, 1 first or 2 second) and the performed moves (I)
+    results: per game three counters (III) of first player wins, second player wins and draws
+"""
+
+MAGIC = b"TTTS"
+VERSION = 2
+_HEADER = struct.Struct("<4sBBHII")
+_GAME_TAIL = struct.Struct("<BI")
+_RESULT = struct.Struct("<III")
+_MASKS = 6
+
+# Symbols used for positions read back from a batch: empty, first player, second player, blocked
+TILES = (".", "X", "O", "#")
+
+
+class SharedBoardBatch:
+    """
+    A batch of game positions and their playout results in one shared memory block.
+    Create it in the parent with `SharedBoardBatch.create`, open it in workers with
+    `SharedBoardBatch.attach(name)` and release it with `close` (and `unlink` in the parent).
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory) -> None:
+        """
+        Args:
+            memory (shared_memory.SharedMemory): A block holding a batch.
+        """
+        magic, version, board_size, width, count, results_offset = _HEADER.unpack_from(memory.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Shared memory block does not hold a board batch.")
+        self.memory = memory
+        self.name = memory.name
+        self.board_size = board_size
+        self.count = count
+        self.tiles = board_size * board_size
+        self.width = width
+        self.stride = _MASKS * width + _GAME_TAIL.size
+        self.results_offset = results_offset
+
+    @classmethod
+    def create(cls, count: int, board_size: int) -> "SharedBoardBatch":
+        """
+        Allocates a zeroed batch: all tiles empty, first player to move, no results.
+
+        Args:
+            count (int): Number of games.
+            board_size (int): The size of the boards (number of rows and columns).
+
+        Returns:
+            SharedBoardBatch: The new batch.
+        """
+        width = (board_size * board_size + 7) // 8
+        stride = _MASKS * width + _GAME_TAIL.size
+        results_offset = -(-(_HEADER.size + count * stride) // 8) * 8
+        memory = shared_memory.SharedMemory(create=True, size=results_offset + count * _RESULT.size)
+        memory.buf[:memory.size] = bytes(memory.size)
+        _HEADER.pack_into(memory.buf, 0, MAGIC, VERSION, board_size, width, count, results_offset)
+        for index in range(count):
+            _GAME_TAIL.pack_into(memory.buf, _HEADER.size + index * stride + _MASKS * width, 1, 0)
+        return cls(memory)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedBoardBatch":
+        """
+        Opens an existing batch by name, e.g. in a worker process.
+
+        Args:
+            name (str): The name of the shared memory block.
+
+        Returns:
+            SharedBoardBatch: The attached batch.
+        """
+        return cls(shared_memory.SharedMemory(name=name))
+
+    def write_game(self, index: int, state: GameState) -> None:
+        """
+        Stores a game position in the batch.
+
+        Args:
+            index (int): The index of the game.
+            state (GameState): The position; its first and second symbols become players 1 and 2.
+        """
+        offset = _HEADER.size + index * self.stride
+        buf = self.memory.buf
+        for board in (state.board_with_all_moves, state.board_with_hidden_moves):
+            for symbol in (state.first_symbol, state.second_symbol, state.blocked_tile):
+                buf[offset:offset + self.width] = board_to_mask(board, symbol).to_bytes(self.width, "little")
+                offset += self.width
+        current = 1 if state.current_player_symbol == state.first_symbol else 2
+        _GAME_TAIL.pack_into(buf, offset, current, state.performed_moves)
+
+    def read_masks(self, index: int) -> Tuple[List[int], int, int]:
+        """
+        Reads a game position as masks, without copying the buffer.
+
+        Args:
+            index (int): The index of the game.
+
+        Returns:
+            tuple: The six masks (see the layout), the player to move (1 or 2) and the performed moves.
+        """
+        width = self.width
+        offset = _HEADER.size + index * self.stride
+        buf = self.memory.buf
+        masks = [int.from_bytes(buf[start:start + width], "little")
+                 for start in range(offset, offset + _MASKS * width, width)]
+        current, performed_moves = _GAME_TAIL.unpack_from(buf, offset + _MASKS * width)
+        if current not in (1, 2):
+            raise ValueError(f"Invalid player to move in game {index}: code {current}.")
+        return masks, current, performed_moves
+
+    def read_game(self, index: int) -> GameState:
+        """
+        Reads a game position back with the symbols of `TILES`.
+
+        Args:
+            index (int): The index of the game.
+
+        Returns:
+            GameState: The position, with "X" as first and "O" as second player.
+        """
+        masks, current, performed_moves = self.read_masks(index)
+        size = self.board_size
+        boards = []
+        for first, second, blocked in (masks[:3], masks[3:]):
+            codes = [1 if first >> cell & 1 else 2 if second >> cell & 1 else 3 if blocked >> cell & 1 else 0
+                     for cell in range(self.tiles)]
+            boards.append([[TILES[code] for code in codes[row:row + size]] for row in range(0, self.tiles, size)])
+        return GameState.from_boards(boards[0], boards[1], TILES[current], TILES[3 - current],
+                                     TILES[0], TILES[3], performed_moves, copy_boards=False,
+                                     first_symbol=TILES[1], second_symbol=TILES[2])
+
+    def write_result(self, index: int, first_wins: int, second_wins: int, draws: int) -> None:
+        """
+        Stores the playout counters of a game.
+
+        Args:
+            index (int): The index of the game.
+            first_wins (int): Playouts won by the first player.
+            second_wins (int): Playouts won by the second player.
+            draws (int): Playouts ending in a draw.
+        """
+        _RESULT.pack_into(self.memory.buf, self.results_offset + index * _RESULT.size, first_wins, second_wins, draws)
+
+    def read_results(self) -> List[Tuple[int, int, int]]:
+        """
+        Reads the playout counters of all games.
+
+        Returns:
+            list: (first wins, second wins, draws) for every game.
+        """
+        return list(_RESULT.iter_unpack(self.memory.buf[self.results_offset:self.results_offset + self.count * _RESULT.size]))
+
+    def close(self) -> None:
+        """
+        Closes this process's view of the batch.
+        """
+        self.memory.close()
+
+    def unlink(self) -> None:
+        """
+        Frees the shared memory block; call once, in the process that created it.
+        """
+        self.memory.unlink()
+
+
+def _shared_worker(name: str, start: int, stop: int, playouts: int, policy: str, seed: Optional[int]) -> None:
+    """
+    Worker function: plays out games start..stop-1 of a shared batch on their masks and writes the results in place.
+    """
+    batch = SharedBoardBatch.attach(name)
+    try:
+        rng = random.Random(None if seed is None else seed + start)
+        max_moves = default_max_moves(batch.board_size)
+        for index in range(start, stop):
+            masks, current, performed_moves = batch.read_masks(index)
+            batch.write_result(index, *count_mask_playouts(batch.board_size, masks, current - 1, performed_moves,
+                                                           policy, playouts, rng, max_moves))
+    finally:
+        batch.close()
+
+
+def _pickled_worker(games: List[tuple], playouts: int, policy: str, seed: Optional[int]) -> List[Tuple[int, int, int]]:
+    """
+    Worker function of the pickling baseline: receives positions as nested lists and returns the results.
+    """
+    rng = random.Random(seed)
+    results = []
+    for board_with_all_moves, board_with_hidden_moves, first, second, current, empty, blocked, performed in games:
+        other = second if current == first else first
+        state = GameState.from_boards(board_with_all_moves, board_with_hidden_moves, current, other,
+                                      empty, blocked, performed, copy_boards=False,
+                                      first_symbol=first, second_symbol=second)
+        outcomes = count_playouts(state, policy, playouts, rng, default_max_moves(state.board_size))
+        results.append((outcomes[first], outcomes[second], outcomes["draw"]))
+    return results
+
+
+def _chunks(count: int, workers: int) -> List[Tuple[int, int]]:
+    """
+    Splits game indices into one contiguous range per task.
+    """
+    tasks = min(count, 4 * workers) or 1
+    bounds = [count * task // tasks for task in range(tasks + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def run_playouts_shared(states: Sequence[GameState], playouts: int = 1, policy: str = "random",
+                        workers: Optional[int] = None, seed: Optional[int] = None) -> List[Tuple[int, int, int]]:
+    """
+    Plays out every position on a process pool through a shared memory batch.
+    Only the block name and index ranges are sent to the workers.
+
+    Args:
+        states (Sequence[GameState]): Positions of equal board size.
+        playouts (int): Number of playouts per position.
+        policy (str): Either "random" or "smart" (see `evaluate.playout`).
+        workers (int): Number of worker processes; None uses all CPUs.
+        seed (int): Seed for reproducible playouts.
+
+    Returns:
+        list: (first wins, second wins, draws) for every position.
+    """
+    if not states:
+        return []
+    batch = SharedBoardBatch.create(len(states), states[0].board_size)
+    try:
+        for index, state in enumerate(states):
+            batch.write_game(index, state)
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            tasks = [executor.submit(_shared_worker, batch.name, start, stop, playouts, policy, seed)
+                     for start, stop in _chunks(len(states), workers)]
+            for task in tasks:
+                task.result()
+        return batch.read_results()
+    finally:
+        batch.close()
+        batch.unlink()
+
+
+def run_playouts_pickled(states: Sequence[GameState], playouts: int = 1, policy: str = "random",
+                         workers: Optional[int] = None, seed: Optional[int] = None) -> List[Tuple[int, int, int]]:
+    """
+    Baseline of `run_playouts_shared` that pickles the boards to the workers and the results back.
+    Accepts the same arguments and returns the same results.
+    """
+    games = [
+        (state.board_with_all_moves, state.board_with_hidden_moves, state.first_symbol, state.second_symbol,
+         state.current_player_symbol, state.empty_tile, state.blocked_tile, state.performed_moves)
+        for state in states
+    ]
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = [executor.submit(_pickled_worker, games[start:stop], playouts, policy,
+                                 None if seed is None else seed + start)
+                 for start, stop in _chunks(len(games), workers)]
+        return [result for task in tasks for result in task.result()]
+
+
+def benchmark(count: int = 20000, board_size: int = 3, playouts: int = 1,
+              workers: Optional[int] = None, seed: int = 0) -> Dict[str, float]:
+    """
+    Times `run_playouts_shared` against `run_playouts_pickled` on random mid-game positions.
+
+    Args:
+        count (int): Number of positions.
+        board_size (int): The size of the boards.
+        playouts (int): Number of playouts per position.
+        workers (int): Number of worker processes; None uses all CPUs.
+        seed (int): Seed of the positions and playouts.
+
+    Returns:
+        dict: Seconds taken by both runners and the speedup of shared memory over pickling.
+    """
+    rng = random.Random(seed)
+    states = []
+    tiles = board_size * board_size
+    for _ in range(count):
+        # Mid-game positions: between a third and two thirds of the tiles played
+        state = GameState("✖️ ", "⭕", board_size, "⬜", "⬛")
+        for _ in range(rng.randint(tiles // 3, 2 * tiles // 3)):
+            if state.push(*computer_move(state, "random", rng)) != "continue":
+                state.pop()
+                break
+        states.append(state)
+
+    timings = {}
+    for name, runner in (("pickled", run_playouts_pickled), ("shared", run_playouts_shared)):
+        start = time.perf_counter()
+        runner(states, playouts, workers=workers, seed=seed)
+        timings[name] = time.perf_counter() - start
+    timings["speedup"] = timings["pickled"] / timings["shared"]
+    return timings
@@ -0,0 +1,189 @@
+from typing import List
+
+from src.bitboard import cell_lines, line_masks, mask_to_cells
+
+"""
+Threat evaluation module for Tic Tac Toe game.
+This module scores every tile for a computer player by the open lines it builds on or blocks.
+A line is open for a player while it holds no opponent stone and no blocked tile; an open line
+with `count` own stones is worth 10 * 100 ** count to the computer (attack) and an open line
+of the opponent is worth 100 ** count (defense). The weights rank a win above a block above
+everything else. Line values and tile scores are updated incrementally on every tile change,
+so picking a move only needs a maximum over the empty tiles.
+"""
+
+EMPTY, OWN, OPPONENT, BLOCKED = range(4)
+
+
+class ThreatEvaluator:
+    """
+    Incrementally maintained threat scores of all tiles from the computer's point of view.
+
+    Like the smart computer, the evaluator sees the board with all moves. Start following
+    a game with `attach(state)`, keep it in sync with `sync(state)` (or `set_tile` for manual
+    updates) and pick moves with `best_move`.
+    """
+
+    def __init__(self, board_size: int, computer_symbol: str, player_symbol: str,
+                 empty_tile: str, blocked_tile: str) -> None:
+        """
+        Args:
+            board_size (int): The size of the board (number of rows and columns).
+            computer_symbol (str): Symbol for the computer.
+            player_symbol (str): Symbol for the opponent.
+            empty_tile (str): The symbol representing an empty tile.
+            blocked_tile (str): The symbol representing a blocked tile.
+        """
+        self.board_size = board_size
+        self.kinds = {empty_tile: EMPTY, computer_symbol: OWN, player_symbol: OPPONENT, blocked_tile: BLOCKED}
+        self.lines = [mask_to_cells(line) for line in line_masks(board_size)]
+        self.cell_lines = cell_lines(board_size)
+        self.applied_moves = 0
+        self.last_record = None
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Resets the evaluator to an empty board.
+        """
+        cells = self.board_size * self.board_size
+        self.tiles = [EMPTY] * cells
+        self.empty = set(range(cells))
+        # counts[line][kind] of tiles in every line
+        self.counts = [[len(line), 0, 0, 0] for line in self.lines]
+        self.line_values = [self._line_value(counts) for counts in self.counts]
+        self.scores = [sum(self.line_values[line] for line in self.cell_lines[cell]) for cell in range(cells)]
+
+    def rebuild(self, board: List[List[str]]) -> None:
+        """
+        Recomputes all counts and scores from a board.
+
+        Args:
+            board (list): The board with all moves.
+        """
+        self.reset()
+        for row, board_row in enumerate(board):
+            for col, tile in enumerate(board_row):
+                kind = self.kinds[tile]
+                if kind != EMPTY:
+                    cell = row * self.board_size + col
+                    self.tiles[cell] = kind
+                    self.empty.discard(cell)
+                    for line in self.cell_lines[cell]:
+                        self.counts[line][EMPTY] -= 1
+                        self.counts[line][kind] += 1
+        self.line_values = [self._line_value(counts) for counts in self.counts]
+        self.scores = [
+            sum(self.line_values[line] for line in self.cell_lines[cell])
+            for cell in range(self.board_size * self.board_size)
+        ]
+
+    def set_tile(self, row: int, col: int, tile: str) -> None:
+        """
+        Records a changed tile and updates the scores of all tiles sharing a line with it.
+
+        Args:
+            row (int): The row index of the tile (0-based).
+            col (int): The column index of the tile (0-based).
+            tile (str): The new content of the tile.
+        """
+        cell = row * self.board_size + col
+        old_kind, new_kind = self.tiles[cell], self.kinds[tile]
+        if old_kind == new_kind:
+            return
+        self.tiles[cell] = new_kind
+        if new_kind == EMPTY:
+            self.empty.add(cell)
+        else:
+            self.empty.discard(cell)
+        scores = self.scores
+        for line in self.cell_lines[cell]:
+            counts = self.counts[line]
+            counts[old_kind] -= 1
+            counts[new_kind] += 1
+            value = self._line_value(counts)
+            delta = value - self.line_values[line]
+            if delta:
+                self.line_values[line] = value
+                for line_cell in self.lines[line]:
+                    scores[line_cell] += delta
+
+    def attach(self, state) -> None:
+        """
+        Starts following a game state from its current position, e.g. a resumed game.
+
+        Args:
+            state (GameState): The game state to follow.
+        """
+        self.rebuild(state.board_with_all_moves)
+        self.applied_moves = len(state.history)
+        self.last_record = state.history[-1] if state.history else None
+
+    def sync(self, state) -> None:
+        """
+        Applies the moves pushed on a game state since the last sync. If moves were taken
+        back in the meantime, the scores are rebuilt from the board.
+
+        Args:
+            state (GameState): The game state to follow.
+        """
+        history = state.history
+        taken_back = len(history) < self.applied_moves or (
+            self.applied_moves and history[self.applied_moves - 1] is not self.last_record
+        )
+        if taken_back:
+            self.rebuild(state.board_with_all_moves)
+        else:
+            board = state.board_with_all_moves
+            for record in history[self.applied_moves:]:
+                # A move leaves its symbol, or a blocked tile, and may clear blocked tiles
+                self.set_tile(record.row, record.col, state.blocked_tile if record.blocked else record.symbol)
+                for changed_board, i, j, _ in record.changes:
+                    if changed_board is board:
+                        self.set_tile(i, j, state.empty_tile)
+        self.applied_moves = len(history)
+        self.last_record = history[-1] if history else None
+
+    def best_move(self, state=None) -> tuple:
+        """
+        Picks the empty tile with the highest threat score (the first one in row-major
+        order on ties).
+
+        Args:
+            state (GameState): If given, the evaluator is synced with it first.
+
+        Returns:
+            tuple: The (row, col) of the move.
+        """
+        if state is not None:
+            self.sync(state)
+        scores = self.scores
+        cell = max(self.empty, key=lambda empty_cell: (scores[empty_cell], -empty_cell))
+        return divmod(cell, self.board_size)
+
+    def score(self, row: int, col: int) -> int:
+        """
+        Returns the threat score of a tile.
+
+        Args:
+            row (int): The row index of the tile (0-based).
+            col (int): The column index of the tile (0-based).
+
+        Returns:
+            int: The score (only meaningful for empty tiles).
+        """
+        return self.scores[row * self.board_size + col]
+
+    @staticmethod
+    def _line_value(counts: List[int]) -> int:
+        """
+        Returns the value of a line for the computer: attack if the line is open for the
+        computer, defense if it is open for the opponent.
+        """
+        value = 0
+        if not counts[BLOCKED]:
+            if not counts[OPPONENT]:
+                value += 10 * 100 ** counts[OWN]
+            if not counts[OWN]:
+                value += 100 ** counts[OPPONENT]
+        return value
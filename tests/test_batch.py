@@ -0,0 +1,40 @@
+"""
+Module for testing batched move selection of the Tic Tac Toe game.
+This module contains unit tests for the `select_computer_moves` function.
+"""
+
+import random
+import pytest
+from src import deftoe
+from src.batch import select_computer_moves
+
+
+def test_select_smart_moves():
+    """
+    Test that the smart strategy wins first, then blocks, for every game of a batch.
+    """
+    win_board = [["O", "O", "⬜"], ["X", "X", "⬜"], ["⬜", "⬜", "⬜"]]
+    block_board = [["X", "⬜", "⬜"], ["X", "O", "⬜"], ["⬜", "⬜", "⬜"]]
+    hidden = deftoe.create_board(3, "⬜")
+    games = [(win_board, hidden, "O", "X"), (block_board, hidden, "O", "X")]
+    assert select_computer_moves(games, "⬜") == [(0, 2), (2, 0)]
+
+
+def test_select_random_moves():
+    """
+    Test that random picks land on empty tiles of the hidden board.
+    """
+    board = [["X", "⬜", "⬜"], ["⬜", "⬜", "⬜"], ["⬜", "⬜", "⬜"]]
+    hidden = [["⬜", "⬛", "⬛"], ["⬛", "⬛", "⬛"], ["⬛", "⬛", "⬜"]]
+    games = [(board, hidden, "O", "X")] * 50
+    moves = select_computer_moves(games, "⬜", strategy="random", rng=random.Random(3))
+    assert set(moves) <= {(0, 0), (2, 2)}
+    assert len(moves) == 50
+
+
+def test_select_moves_invalid_strategy():
+    """
+    Test that an unknown strategy is rejected.
+    """
+    with pytest.raises(ValueError):
+        select_computer_moves([], "⬜", strategy="perfect")
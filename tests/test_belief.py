@@ -0,0 +1,89 @@
+"""
+Module for testing the belief-state tracker of the Tic Tac Toe game.
+This module contains unit tests for the bitboard helpers and the BeliefState class.
+"""
+
+import random
+from src import bitboard
+from src.belief import BeliefState
+
+
+def test_line_masks():
+    """
+    Test the `line_masks` and `has_line` functions against `check_win` style lines.
+    """
+    masks = bitboard.line_masks(3)
+    assert len(masks) == 8
+    assert masks[0] == 0b000000111  # first row
+    assert masks[3] == 0b001001001  # first column
+    assert masks[6] == 0b100010001  # diagonal
+    assert masks[7] == 0b001010100  # anti-diagonal
+    assert bitboard.has_line(0b100010001, 3) is True
+    assert bitboard.has_line(0b000010001, 3) is False
+    assert bitboard.has_line_through(0b100010001, 4, 3) is True
+    assert bitboard.has_line_through(0b000000111, 4, 3) is False
+
+
+def test_board_to_mask():
+    """
+    Test the `board_to_mask` and `mask_to_cells` functions.
+    """
+    board = [["X", "⬜", "O"], ["⬜", "X", "⬜"], ["⬛", "⬜", "⬜"]]
+    mask = bitboard.board_to_mask(board, "X")
+    assert mask == bitboard.cell_bit(0, 0, 3) | bitboard.cell_bit(1, 1, 3)
+    assert bitboard.mask_to_cells(mask) == [0, 4]
+
+
+def test_belief_uniform_after_hidden_move():
+    """
+    Test that a single hidden opponent move is spread uniformly over the free cells.
+    """
+    belief = BeliefState(3)
+    belief.observe_own_move(1, 1)
+    belief.observe_opponent_move()
+    assert belief.probability(1, 1) == 0
+    assert abs(belief.probability(0, 0) - 1 / 8) < 1e-9
+    assert abs(sum(sum(row) for row in belief.probabilities()) - 1) < 1e-9
+
+
+def test_belief_excludes_completed_lines():
+    """
+    Test that configurations completing an opponent line are ruled out.
+    """
+    belief = BeliefState(3)
+    board = [["O", "O", "⬜"], ["⬜", "X", "⬜"], ["⬜", "⬜", "X"]]
+    belief.observe_reveal(board, "X", "O", "⬛")
+    belief.observe_opponent_move()
+    assert belief.probability(0, 2) == 0
+    assert belief.probability(0, 0) == 1
+    assert abs(belief.probability(1, 0) - 1 / 4) < 1e-9
+
+
+def test_belief_own_move_collapses():
+    """
+    Test that own placements remove the cell from the belief and that reveals reset it.
+    """
+    belief = BeliefState(2)
+    belief.observe_opponent_move()
+    for row, col in [(0, 0), (0, 1), (1, 0)]:
+        belief.observe_own_move(row, col)
+    assert belief.probability(1, 1) == 1
+
+    belief.observe_reveal([["X", "⬛"], ["⬜", "⬜"]], "X", "O", "⬛")
+    assert belief.probabilities() == [[0, 0], [0, 0]]
+    belief.observe_clear()
+    belief.observe_opponent_move()
+    assert abs(belief.probability(0, 1) - 1 / 3) < 1e-9
+
+
+def test_belief_particles_on_large_board():
+    """
+    Test that large boards switch to particle sampling and keep valid probabilities.
+    """
+    belief = BeliefState(9, max_configurations=1000, particles=500, rng=random.Random(1))
+    for _ in range(3):
+        belief.observe_opponent_move()
+    assert belief.is_exact is False
+    belief.observe_own_move(4, 4)
+    assert belief.probability(4, 4) == 0
+    assert abs(sum(sum(row) for row in belief.probabilities()) - 3) < 1e-9
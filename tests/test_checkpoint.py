@@ -0,0 +1,87 @@
+"""
+Module for testing checkpoints of the Tic Tac Toe game.
+This module contains unit tests for serializing and resuming games in progress.
+"""
+
+import random
+import pytest
+from src import checkpoint, deftoe
+
+
+def make_games(count, seed=0):
+    """
+    Plays a few random moves in `count` games and returns the states.
+    """
+    rng = random.Random(seed)
+    games = []
+    for index in range(count):
+        state = deftoe.GameState("✖️ ", "⭕", 3 + index % 3, "⬜", "⬛")
+        for _ in range(rng.randrange(6)):
+            empty = [(i, j) for i in range(state.board_size) for j in range(state.board_size)
+                     if state.board_with_hidden_moves[i][j] == "⬜"]
+            if state.push(*rng.choice(empty)) != "continue":
+                state.pop()
+                break
+        games.append(state)
+    return games
+
+
+def test_dumps_loads_round_trip():
+    """
+    Test that games, scores, random state and settings survive a round trip.
+    """
+    games = make_games(20)
+    random_state = random.Random(5).getstate()
+    data = checkpoint.dumps(games, (3, 1, 2), random_state, {"mode": "2"})
+    restored = checkpoint.loads(data)
+
+    assert restored.scores == (3, 1, 2)
+    assert restored.random_state == random_state
+    assert restored.extra == {"mode": "2"}
+    for original, game in zip(games, restored.games):
+        assert game.board_with_all_moves == original.board_with_all_moves
+        assert game.board_with_hidden_moves == original.board_with_hidden_moves
+        assert (game.first_symbol, game.second_symbol) == (original.first_symbol, original.second_symbol)
+        assert game.current_player_symbol == original.current_player_symbol
+        assert game.performed_moves == original.performed_moves
+        assert (game.empty_count, game.blocked_count) == (original.empty_count, original.blocked_count)
+
+
+def test_loads_rejects_unknown_data():
+    """
+    Test that foreign data and unknown versions are rejected.
+    """
+    with pytest.raises(ValueError):
+        checkpoint.loads(b"nope")
+    data = bytearray(checkpoint.dumps([]))
+    data[4] = 99
+    with pytest.raises(ValueError):
+        checkpoint.loads(bytes(data))
+
+
+def test_loads_rejects_truncated_data():
+    """
+    Test that every truncation and any trailing bytes are rejected with ValueError.
+    """
+    data = checkpoint.dumps(make_games(2), (1, 2, 3), random.Random(4).getstate(), {"mode": "2"})
+    for length in range(len(data)):
+        with pytest.raises(ValueError):
+            checkpoint.loads(data[:length])
+    with pytest.raises(ValueError):
+        checkpoint.loads(data + b"\x00")
+    assert len(checkpoint.loads(data).games) == 2
+
+
+def test_checkpointer_saves_periodically(tmp_path):
+    """
+    Test that the checkpointer respects its interval and writes atomically readable files.
+    """
+    path = str(tmp_path / "games.bin")
+    checkpointer = checkpoint.Checkpointer(path, interval=60)
+    assert checkpointer.maybe_save(make_games(3), (1, 0, 0)) is True
+    assert checkpointer.maybe_save(make_games(4), (2, 0, 0)) is False
+    restored = checkpoint.load(path)
+    assert len(restored.games) == 3
+    assert restored.scores == (1, 0, 0)
+    checkpointer.remove()
+    assert not (tmp_path / "games.bin").exists()
@@ -0,0 +1,113 @@
+"""
+Module for testing the Monte Carlo position evaluator of the Tic Tac Toe game.
+This module contains unit tests for playouts and the early-stopping evaluation.
+"""
+
+import random
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+from src import deftoe
+from src.batch import computer_move
+from src.bitboard import board_to_mask
+from src.evaluate import DRAW, FIRST_WINS, SECOND_WINS, evaluate_position, iter_evaluation, mask_playout, playout, wilson_margin
+
+
+def test_playout_restores_state():
+    """
+    Test that a playout ends with a valid result and leaves the state untouched.
+    """
+    state = deftoe.GameState("X", "O", 3, "⬜", "⬛")
+    state.push(1, 1)
+    rng = random.Random(0)
+    for policy in ("random", "smart"):
+        for _ in range(20):
+            assert playout(state, policy, rng, 90) in ("X", "O", "draw")
+            assert state.performed_moves == 1
+            assert len(state.history) == 1
+            assert state.board_with_all_moves[1][1] == "X"
+
+
+def test_mask_playout_matches_playout():
+    """
+    Test that playouts on bitmasks give the same outcome as playouts on the game state
+    for the same position and seed.
+    """
+    outcomes = {"X": FIRST_WINS, "O": SECOND_WINS, "draw": DRAW}
+    for size in (3, 4):
+        for seed in range(40):
+            rng = random.Random(seed)
+            state = deftoe.GameState("X", "O", size, "⬜", "⬛")
+            for _ in range(rng.randrange(size * size)):
+                if state.push(*computer_move(state, "random", rng)) != "continue":
+                    state.pop()
+                    break
+            masks = [board_to_mask(board, tile)
+                     for board in (state.board_with_all_moves, state.board_with_hidden_moves)
+                     for tile in ("X", "O", "⬛")]
+            current = 0 if state.current_player_symbol == "X" else 1
+            for policy in ("random", "smart"):
+                expected = outcomes[playout(state, policy, random.Random(seed), 10 * size * size)]
+                assert mask_playout(size, masks, current, state.performed_moves, policy,
+                                    random.Random(seed), 10 * size * size) == expected
+
+
+def test_wilson_margin():
+    """
+    Test that the Wilson margin shrinks with more trials and stays positive at p = 0.
+    """
+    assert wilson_margin(0, 0, 0.95) == 1.0
+    assert 0 < wilson_margin(0, 100, 0.95) < wilson_margin(0, 10, 0.95)
+    assert abs(wilson_margin(500, 1000, 0.95) - 0.031) < 0.001
+
+
+def test_evaluate_decided_position():
+    """
+    Test that a position with a forced win under the smart policy stops early.
+    """
+    board = [["X", "X", "⬜"], ["O", "O", "⬜"], ["⬜", "⬜", "⬜"]]
+    evaluation = evaluate_position(board, board, "X", "O", "⬜", "⬛", performed_moves=4,
+                                   policy="smart", tolerance=0.01, batch_size=200, workers=0, seed=1)
+    assert evaluation.probabilities["X"] == 1.0
+    assert evaluation.margin < 0.01
+    assert evaluation.playouts < 100000
+    assert evaluation.playouts_per_second > 0
+
+
+def test_iter_evaluation_process_pool():
+    """
+    Test that the process pool streams partial results up to the playout limit.
+    """
+    board = deftoe.create_board(3, "⬜")
+    evaluations = list(iter_evaluation(board, board, "X", "O", "⬜", "⬛", performed_moves=0,
+                                       tolerance=0.0, max_playouts=400, batch_size=100, workers=2, seed=3))
+    assert [evaluation.playouts for evaluation in evaluations] == [100, 200, 300, 400]
+    assert sum(evaluations[-1].outcomes.values()) == 400
+
+
+def test_iter_evaluation_stops_without_waiting():
+    """
+    Test that leaving the evaluation early cancels the queued batches and shuts the pool
+    down without waiting for the running ones.
+    """
+    futures = []
+
+    def submit(function, state, policy, count, seed, max_moves):
+        # Only the first batch finishes; the others stay pending
+        future = Future()
+        if not futures:
+            future.set_result({state.first_symbol: count, state.second_symbol: 0, "draw": 0})
+        futures.append(future)
+        return future
+
+    executor = MagicMock()
+    executor.submit.side_effect = submit
+    board = deftoe.create_board(3, "⬜")
+    with patch('src.evaluate.ProcessPoolExecutor', return_value=executor):
+        evaluations = iter_evaluation(board, board, "X", "O", "⬜", "⬛", performed_moves=0,
+                                      tolerance=0.0, batch_size=10, workers=2, seed=5)
+        assert next(evaluations).playouts == 10
+        evaluations.close()
+
+    assert len(futures) == 4
+    assert all(future.cancelled() for future in futures[1:])
+    executor.shutdown.assert_called_once_with(wait=False)
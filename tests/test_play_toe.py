@@ -0,0 +1,149 @@
+"""
+Module for testing the command line entry point of the Tic Tac Toe game.
+This module contains unit tests for argument parsing and non-interactive games.
+"""
+
+import io
+import json
+import os
+import random
+import pytest
+from unittest.mock import patch
+import play_toe
+from src import checkpoint, deftoe
+
+
+def test_parse_args_modes():
+    """
+    Test that game modes and player types map onto each other.
+    """
+    args = play_toe.parse_args(["--mode", "3"])
+    assert (args.player1, args.player2) == ("human", "smart")
+
+    args = play_toe.parse_args(["--player1", "human", "--player2", "random"])
+    assert args.mode == "2"
+
+    args = play_toe.parse_args(["--player1", "random", "--player2", "smart", "--games", "5"])
+    assert args.mode is None
+    assert args.games == 5
+
+    with pytest.raises(SystemExit):
+        play_toe.parse_args(["--player1", "smart", "--player2", "human"])
+    with pytest.raises(SystemExit):
+        play_toe.parse_args(["--mode", "1", "--player1", "random"])
+
+
+def test_play_computer_games_json_lines(tmp_path, capsys):
+    """
+    Test that computer games print one reproducible JSON line per game and update ratings.
+    """
+    ratings_path = str(tmp_path / "ratings.json")
+    args = play_toe.parse_args(["--player1", "random", "--player2", "smart", "--games", "4",
+                                "--seed", "10", "--ratings", ratings_path])
+    output = io.StringIO()
+    play_toe.play_computer_games(args, output)
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert [line["game"] for line in lines] == [1, 2, 3, 4]
+    assert [line["first"] for line in lines] == ["player1", "player2", "player1", "player2"]
+    assert all(line["result"] in ("player1", "player2", "draw") for line in lines)
+
+    repeated = io.StringIO()
+    args.ratings = None
+    play_toe.play_computer_games(args, repeated)
+    assert repeated.getvalue() == output.getvalue()
+
+    with open(ratings_path, encoding="utf-8") as file:
+        assert json.load(file)["players"]["smart"][3] == 4
+    report = capsys.readouterr().err.splitlines()
+    assert [line.split(":")[0] for line in report] == ["random", "smart"]
+    assert "95% interval" in report[1] and "4 games" in report[1]
+
+
+def test_play_computer_games_resume(tmp_path, monkeypatch):
+    """
+    Test that an interrupted run resumes from its checkpoint with the same games and ratings.
+    """
+    class InterruptedOutput(io.StringIO):
+        def write(self, text):
+            if self.getvalue().count("\n") == 3:
+                raise KeyboardInterrupt
+            return super().write(text)
+
+    monkeypatch.setattr(play_toe, "checkpoint_interval", 0)
+    arguments = ["--player1", "random", "--player2", "threat", "--games", "6", "--seed", "7"]
+    expected = io.StringIO()
+    play_toe.play_computer_games(play_toe.parse_args(arguments + ["--ratings", str(tmp_path / "a.json")]),
+                                 expected)
+
+    args = play_toe.parse_args(arguments + ["--ratings", str(tmp_path / "b.json"),
+                                            "--checkpoint", str(tmp_path / "run.bin")])
+    interrupted = InterruptedOutput()
+    with pytest.raises(KeyboardInterrupt):
+        play_toe.play_computer_games(args, interrupted)
+    assert (tmp_path / "run.bin").exists()
+    with pytest.raises(ValueError):
+        play_toe.play_computer_games(play_toe.parse_args(
+            arguments[:-1] + ["8", "--ratings", str(tmp_path / "b.json"), "--checkpoint", str(tmp_path / "run.bin")]
+        ), io.StringIO())
+    resumed = io.StringIO()
+    play_toe.play_computer_games(args, resumed)
+
+    assert interrupted.getvalue() + resumed.getvalue() == expected.getvalue()
+    assert (tmp_path / "a.json").read_text() == (tmp_path / "b.json").read_text()
+    assert not (tmp_path / "run.bin").exists()
+
+    with pytest.raises(SystemExit):
+        play_toe.parse_args(["--checkpoint", "run.bin"])
+
+
+@pytest.mark.parametrize("mode", ["2", "3", "4"])
+def test_resume_keeps_board_size(tmp_path, monkeypatch, mode):
+    """
+    Test that a resumed session plays on the board size of the saved game, not the default.
+    """
+    path = str(tmp_path / "checkpoint.bin")
+    monkeypatch.setattr(play_toe, "checkpoint_path", path)
+    state = deftoe.GameState(play_toe.player1_symbol, play_toe.player2_symbol, 5,
+                             play_toe.empty_tile, play_toe.blocked_tile)
+    for row, col in [(4, 4), (4, 3), (4, 2)]:
+        state.push(row, col)
+    checkpoint.save(path, [state], (0, 0, 0), None,
+                    {"mode": mode, "first_symbol": play_toe.player1_symbol, "board_size": "5"})
+
+    def human_move(state):
+        # Always the first empty tile of the hidden board
+        return next((i, j) for i in range(state.board_size) for j in range(state.board_size)
+                    if state.board_with_hidden_moves[i][j] == state.empty_tile)
+
+    random.seed(0)
+    with patch('builtins.input', side_effect=["yes", ""]), \
+         patch('src.deftoe.clear_screen'), \
+         patch('src.deftoe.human_move', side_effect=human_move):
+        play_toe.play_interactive(play_toe.parse_args(["--games", "1"]))
+    assert not os.path.exists(path)
+
+
+def test_resume_rejects_broken_checkpoint(tmp_path, monkeypatch, capsys):
+    """
+    Test that a truncated checkpoint starts a new session instead of resuming a broken game.
+    """
+    path = str(tmp_path / "checkpoint.bin")
+    monkeypatch.setattr(play_toe, "checkpoint_path", path)
+    state = deftoe.GameState(play_toe.player1_symbol, play_toe.player2_symbol, 5,
+                             play_toe.empty_tile, play_toe.blocked_tile)
+    data = checkpoint.dumps([state], (0, 0, 0), None, {"mode": "2", "first_symbol": play_toe.player1_symbol})
+    with open(path, "wb") as file:
+        file.write(data[:-5])
+
+    def human_move(state):
+        assert state.board_size == 3
+        return next((i, j) for i in range(state.board_size) for j in range(state.board_size)
+                    if state.board_with_hidden_moves[i][j] == state.empty_tile)
+
+    random.seed(0)
+    with patch('builtins.input', side_effect=["yes", ""]), \
+         patch('src.deftoe.clear_screen'), \
+         patch('src.deftoe.human_move', side_effect=human_move):
+        play_toe.play_interactive(play_toe.parse_args(["--mode", "2", "--games", "1"]))
+    assert "cannot be resumed" in capsys.readouterr().out
@@ -0,0 +1,67 @@
+"""
+Module for testing the rating engine of the Tic Tac Toe game.
+This module contains unit tests for Glicko-2 updates, first-move advantage and persistence.
+"""
+
+import random
+import pytest
+from src.rating import Rating, RatingEngine, _new_volatility
+
+
+def test_new_volatility_matches_glicko2_example():
+    """
+    Test the volatility step against the worked example of the Glicko-2 paper.
+    """
+    sigma = _new_volatility(1.1513, 0.06, -0.4834, 1.7785, 0.5)
+    assert abs(sigma - 0.05999) < 0.00001
+
+
+def test_update_moves_ratings():
+    """
+    Test that a win raises the winner, lowers the loser and shrinks both deviations.
+    """
+    engine = RatingEngine()
+    engine.update("smart", "random", "smart")
+    smart, random_player = engine.get("smart"), engine.get("random")
+    assert smart.rating > 1500 > random_player.rating
+    assert smart.deviation < 350 and random_player.deviation < 350
+    assert smart.games == random_player.games == 1
+
+    engine.update("smart", "random", "draw")
+    assert engine.get("smart").games == 2
+    with pytest.raises(ValueError):
+        engine.update("smart", "random", "O")
+
+
+def test_stronger_player_and_first_move_advantage():
+    """
+    Test that a stream of results separates the players and learns the first-move advantage.
+    """
+    rng = random.Random(1)
+    engine = RatingEngine()
+
+    def results():
+        for index in range(2000):
+            first, second = ("smart", "random") if index % 2 else ("random", "smart")
+            win_chance = (0.75 if first == "smart" else 0.35)
+            yield first, second, first if rng.random() < win_chance else second
+
+    assert engine.update_many(results()) == 2000
+    low, high = engine.interval("smart")
+    assert low < engine.get("smart").rating < high
+    assert engine.get("smart").rating > engine.get("random").rating
+    assert engine.first_move_advantage > 0
+
+
+def test_save_and_load(tmp_path):
+    """
+    Test that ratings persist between runs.
+    """
+    path = str(tmp_path / "ratings.json")
+    engine = RatingEngine()
+    engine.update("smart", "random", "smart")
+    engine.save(path)
+    loaded = RatingEngine.load(path)
+    assert loaded.get("smart") == engine.get("smart")
+    assert loaded.first_move_advantage == engine.first_move_advantage
+    assert loaded.get("nobody") == Rating()
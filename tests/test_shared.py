@@ -0,0 +1,96 @@
+"""
+Module for testing shared memory board batches of the Tic Tac Toe game.
+This module contains unit tests for the SharedBoardBatch class and the process-pool runners.
+"""
+
+import struct
+import pytest
+from src import deftoe
+from src.shared import SharedBoardBatch, run_playouts_pickled, run_playouts_shared
+
+
+def make_states():
+    """
+    Returns a few 3x3 positions, including a revealed board and a blocked tile.
+    """
+    empty = deftoe.GameState("✖️ ", "⭕", 3, "⬜", "⬛")
+    revealed = deftoe.GameState("✖️ ", "⭕", 3, "⬜", "⬛")
+    for move in [(0, 0), (1, 1), (2, 2), (0, 0)]:
+        revealed.push(*move)
+    decided = deftoe.GameState("✖️ ", "⭕", 3, "⬜", "⬛")
+    for move in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+        decided.push(*move)
+    return [empty, revealed, decided]
+
+
+def test_batch_round_trip():
+    """
+    Test that positions written to a batch are read back with the same tiles and counters.
+    """
+    states = make_states()
+    batch = SharedBoardBatch.create(len(states), 3)
+    try:
+        for index, state in enumerate(states):
+            batch.write_game(index, state)
+        attached = SharedBoardBatch.attach(batch.name)
+        symbols = {"✖️ ": "X", "⭕": "O", "⬜": ".", "⬛": "#"}
+        for index, state in enumerate(states):
+            game = attached.read_game(index)
+            assert game.board_with_all_moves == [[symbols[tile] for tile in row] for row in state.board_with_all_moves]
+            assert game.board_with_hidden_moves == [[symbols[tile] for tile in row] for row in state.board_with_hidden_moves]
+            assert game.current_player_symbol == symbols[state.current_player_symbol]
+            assert game.performed_moves == state.performed_moves
+            assert (game.empty_count, game.blocked_count) == (state.empty_count, state.blocked_count)
+
+        attached.write_result(1, 3, 2, 1)
+        assert batch.read_results() == [(0, 0, 0), (3, 2, 1), (0, 0, 0)]
+        attached.close()
+    finally:
+        batch.close()
+        batch.unlink()
+
+
+def test_unwritten_game_is_a_new_game():
+    """
+    Test that a slot never written holds an empty board with the first player to move,
+    and that an invalid player to move is rejected.
+    """
+    batch = SharedBoardBatch.create(2, 3)
+    try:
+        game = batch.read_game(1)
+        assert game.board_with_all_moves == [["."] * 3 for _ in range(3)]
+        assert (game.current_player_symbol, game.performed_moves, game.status) == ("X", 0, "continue")
+
+        # Player to move of game 0: right after the header and its six masks
+        batch.memory.buf[struct.calcsize("<4sBBHII") + 6 * batch.width] = 0
+        with pytest.raises(ValueError):
+            batch.read_game(0)
+    finally:
+        batch.close()
+        batch.unlink()
+
+
+def test_attach_rejects_foreign_memory():
+    """
+    Test that a block without the batch header is rejected.
+    """
+    from multiprocessing import shared_memory
+    memory = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            SharedBoardBatch(memory)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def test_shared_runner_matches_pickled_runner():
+    """
+    Test that both runners produce the same results for the same seed.
+    """
+    states = make_states() * 4
+    shared = run_playouts_shared(states, playouts=20, policy="smart", workers=2, seed=5)
+    pickled = run_playouts_pickled(states, playouts=20, policy="smart", workers=2, seed=5)
+    assert shared == pickled
+    assert all(sum(result) == 20 for result in shared)
+    assert shared[2] == (20, 0, 0)
@@ -0,0 +1,99 @@
+"""
+Module for testing the threat evaluator of the Tic Tac Toe game.
+This module contains unit tests for the ThreatEvaluator class and the threat computer mode.
+"""
+
+import random
+from unittest.mock import patch
+from src import deftoe
+from src.batch import computer_move
+from src.threats import ThreatEvaluator
+
+
+def make_evaluator(board):
+    """
+    Creates an evaluator for computer "O" against "X" following the given board.
+    """
+    evaluator = ThreatEvaluator(len(board), "O", "X", "⬜", "⬛")
+    evaluator.rebuild(board)
+    return evaluator
+
+
+def test_best_move_wins_then_blocks():
+    """
+    Test that the evaluator completes its own line before blocking the opponent.
+    """
+    board = [["O", "O", "⬜"], ["X", "X", "⬜"], ["X", "⬜", "⬜"]]
+    assert make_evaluator(board).best_move() == (0, 2)
+
+    board = [["X", "X", "⬜"], ["O", "⬜", "⬜"], ["⬜", "⬜", "⬜"]]
+    assert make_evaluator(board).best_move() == (0, 2)
+
+    assert make_evaluator(deftoe.create_board(5, "⬜")).best_move() == (2, 2)
+
+
+def test_blocked_lines_are_worthless():
+    """
+    Test that a blocked tile closes every line through it.
+    """
+    board = [["⬛", "⬜", "⬜"], ["⬜", "⬜", "⬜"], ["⬜", "⬜", "⬜"]]
+    evaluator = make_evaluator(board)
+    open_line = make_evaluator(deftoe.create_board(3, "⬜")).score(0, 1) // 2
+    assert evaluator.score(0, 1) == open_line  # column only, the row is blocked
+    assert evaluator.score(1, 1) == 3 * open_line  # row, column and anti-diagonal
+    assert evaluator.score(2, 2) == 2 * open_line  # row and column, the diagonal is blocked
+
+
+def test_incremental_scores_match_rebuild():
+    """
+    Test that syncing with pushed and popped moves gives the same scores as a rebuild.
+    """
+    rng = random.Random(2)
+    for board_size in (3, 4, 7):
+        state = deftoe.GameState("X", "O", board_size, "⬜", "⬛")
+        evaluator = ThreatEvaluator(board_size, "O", "X", "⬜", "⬛")
+        evaluator.attach(state)
+        for step in range(60):
+            if state.status != "continue":
+                state.pop()
+            elif step % 7 == 6 and state.history:
+                state.pop()
+            else:
+                state.push(*computer_move(state, "random", rng))
+            evaluator.sync(state)
+            expected = make_evaluator(state.board_with_all_moves)
+            assert evaluator.scores == expected.scores
+            assert evaluator.empty == expected.empty
+
+
+def test_game_vs_threat_computer():
+    """
+    Test the `game_vs_threat_computer` function for a complete game simulation.
+    """
+    moves = ["", "A1", "A2", "A3", "B1", "B2", "B3", "C1", "C2", "C3"] * 6
+    with patch('builtins.input', side_effect=moves), \
+         patch('src.deftoe.clear_screen'), \
+         patch('src.deftoe.format_board', return_value="formatted_board"):
+        result = deftoe.game_vs_threat_computer("X", "O", 3, "⬜", "⬛")
+        assert result in ["X", "O", "draw"]
+
+
+def test_game_vs_threat_computer_resumed_larger_board():
+    """
+    Test that a resumed game is played on its own board size, not the `board_size` argument.
+    """
+    state = deftoe.GameState("X", "O", 5, "⬜", "⬛")
+    state.push(0, 0)
+
+    def human_move(state):
+        # Always the first empty tile of the hidden board
+        return next((i, j) for i in range(state.board_size) for j in range(state.board_size)
+                    if state.board_with_hidden_moves[i][j] == "⬜")
+
+    with patch('builtins.input', return_value=""), \
+         patch('src.deftoe.clear_screen'), \
+         patch('src.deftoe.format_board', return_value="formatted_board"), \
+         patch('src.deftoe.human_move', side_effect=human_move):
+        result = deftoe.game_vs_threat_computer("X", "O", 3, "⬜", "⬛", state=state)
+    assert result in ["X", "O", "draw"]
+    assert state.performed_moves > 1
@@ -5,6 +5,9 @@ This module contains unit tests for various functions in the game logic.
 
 import sys
 import os
+import random
+import pytest
+from copy import deepcopy
 from unittest.mock import patch
 from src import deftoe
 
@@ -296,4 +299,118 @@ def test_game_vs_smart_computer():
          patch('deftoe.clear_screen'), \
          patch('deftoe.format_board', return_value="formatted_board"):
         result = deftoe.game_vs_smart_computer(player_symbol, computer_symbol, board_size, empty_tile, blocked_tile)
-        assert result in [player_symbol, computer_symbol, "draw"]
\ No newline at end of file
+        assert result in [player_symbol, computer_symbol, "draw"]
+
+def test_check_win_at():
+    """
+    Test the `check_win_at` function for lines through the last move.
+    """
+    board = [["X", "⬜", "O"], ["⬜", "X", "O"], ["⬜", "⬜", "X"]]
+    assert deftoe.check_win_at(board, 2, 2, "X") is True
+    assert deftoe.check_win_at(board, 1, 2, "O") is False
+    board[2][2] = "O"
+    assert deftoe.check_win_at(board, 2, 2, "O") is True
+    assert deftoe.check_win_at(board, 1, 1, "X") is False
+
+
+def test_game_state_push():
+    """
+    Test that `GameState.push` follows the same rules as the game loop: reveal after
+    three moves, blocking a hit tile and clearing blocked tiles on a full board.
+    """
+    state = deftoe.GameState("X", "O", 3, "⬜", "⬛")
+    for row, col in [(0, 0), (1, 1), (2, 2)]:
+        assert state.push(row, col) == "continue"
+    assert state.board_with_hidden_moves == state.board_with_all_moves
+    assert state.current_player_symbol == "O"
+
+    state = deftoe.GameState("X", "O", 2, "⬜", "⬛")
+    state.push(0, 0)
+    state.push(0, 1)
+    assert state.board_with_hidden_moves == [["⬜", "⬜"], ["⬜", "⬜"]]
+    assert state.push(0, 0) == "continue"
+    assert state.last_move_blocked is True
+    assert state.history[-1][:5] == deftoe.MoveRecord(0, 0, "X", "X", True, False, 2, 0, [])[:5]
+    assert state.board_with_all_moves == [["⬛", "O"], ["⬜", "⬜"]]
+    assert state.board_with_hidden_moves == state.board_with_all_moves
+
+    state.push(0, 1)
+    state.push(1, 0)
+    assert state.push(1, 1) == "continue"
+    assert state.last_move_cleared is True
+    assert state.board_with_all_moves == [["⬜", "⬜"], ["X", "O"]]
+    assert state.board_with_hidden_moves == [["⬜", "⬜"], ["⬜", "⬜"]]
+
+    assert state.push(0, 0) == "X"
+    assert state.current_player_symbol == "X"
+    with pytest.raises(ValueError):
+        state.push(0, 1)
+
+
+def test_legacy_helpers_match_game_state():
+    """
+    Test that `process_validated_move` and `check_game_status` apply the same rules as `GameState.push`.
+    """
+    state = deftoe.GameState("X", "O", 2, "⬜", "⬛")
+    board = deftoe.create_board(2, "⬜")
+    hidden_board = deftoe.create_board(2, "⬜")
+    with patch('src.deftoe.clear_screen'):
+        for row, col, symbol in [(0, 0, "X"), (0, 1, "O"), (0, 0, "X"), (0, 1, "O"), (1, 0, "X"), (1, 1, "O")]:
+            state.push(row, col)
+            board, hidden_board, _ = deftoe.process_validated_move(row, col, board, hidden_board, symbol, "⬜", "⬛")
+            assert deftoe.check_game_status(board, hidden_board, symbol, "⬜", "⬛") == state.status
+            assert board == state.board_with_all_moves
+            if state.last_move_blocked or state.last_move_cleared:
+                assert hidden_board == state.board_with_hidden_moves
+
+
+def test_game_state_from_boards():
+    """
+    Test that `GameState.from_boards` keeps the player to move apart from the starting player.
+    """
+    board = [["X", "⬜", "⬜"], ["⬜", "⬜", "⬜"], ["⬜", "⬜", "⬜"]]
+    state = deftoe.GameState.from_boards(board, board, "O", "X", "⬜", "⬛", 1, first_symbol="X", second_symbol="O")
+    assert (state.first_symbol, state.second_symbol, state.current_player_symbol) == ("X", "O", "O")
+    assert state.board_with_all_moves is not board
+    state.push(1, 1)
+    assert state.current_player_symbol == "X"
+
+    state = deftoe.GameState.from_boards(board, board, "O", "X", "⬜", "⬛", 1, copy_boards=False)
+    assert (state.first_symbol, state.second_symbol) == ("O", "X")
+    assert state.board_with_all_moves is board
+
+
+def test_game_state_pop_restores_state():
+    """
+    Test that popping every move of random games restores each earlier position exactly.
+    """
+    rng = random.Random(7)
+    for board_size in (2, 3, 4):
+        state = deftoe.GameState("X", "O", board_size, "⬜", "⬛")
+        snapshots = []
+        while state.status == "continue" and len(snapshots) < 200:
+            snapshots.append((deepcopy(state.board_with_all_moves), deepcopy(state.board_with_hidden_moves),
+                              state.current_player_symbol, state.performed_moves))
+            empty = [(i, j) for i in range(board_size) for j in range(board_size)
+                     if state.board_with_hidden_moves[i][j] == "⬜"]
+            state.push(*rng.choice(empty))
+
+        while snapshots:
+            state.pop()
+            assert (state.board_with_all_moves, state.board_with_hidden_moves,
+                    state.current_player_symbol, state.performed_moves) == snapshots.pop()
+        assert state.status == "continue"
+        with pytest.raises(IndexError):
+            state.pop()
+
+
+def test_game_flow_with_undo():
+    """
+    Test that entering 'undo' in the `game` function takes back the last move.
+    """
+    moves = ["", "A1", "undo", "B1", "A1", "B2", "C1", "B3"]  # A1 is taken back, X wins column B
+    with patch('builtins.input', side_effect=moves), \
+         patch('src.deftoe.clear_screen'), \
+         patch('src.deftoe.format_board', return_value="formatted_board"):
+        result = deftoe.game("X", "O", 3, "⬜", "⬛")
+        assert result == "X"